@@ -0,0 +1,39 @@
+"""Shared simulation components used by the SIR, SEIRS and SEIRD models."""
+
+from .population import (
+    DEAD,
+    EXPOSED,
+    IMMUNE,
+    INFECTED,
+    PALETTE,
+    RECOVERED,
+    STATE_CODES,
+    STATE_LABELS,
+    SUSCEPTIBLE,
+    Population,
+)
+from .backend import BACKENDS, backend_available, get_backend, set_backend
+from .rng import RandomStream, as_seed_sequence
+from .spatial import NeighbourGraph, SpatialHash
+from .batch import BatchPopulation, ReplicatedGraph
+from .infection import (
+    contact_checks,
+    infect,
+    infect_in_order,
+    infection_probability,
+)
+from .ensemble import (
+    compartment_series,
+    recorded_series,
+    run_ensemble,
+    series_names,
+)
+from .placement import PLACEMENTS, place, placement_key, resolve_placement
+from .layout import Layout
+from .cache import LayoutCache, cached_layout, get_cache, set_cache
+from .individual import Individual, IndividualViews
+from .transitions import Infection, Transition, compile_transitions
+from .engine import CompartmentModel
+from .result import SimulationResult
+from .profiling import OPERATIONS, OperationCounts, PhaseProfile
+from .sweep import grid, latin_hypercube, run_sweep, summarize
@@ -0,0 +1,76 @@
+import os
+import warnings
+
+# Implementations of the daily infection and timer steps
+BACKENDS = ("numpy", "numba", "sparse")
+
+# Optional module each backend needs
+REQUIREMENTS = {"numba": "numba", "sparse": "scipy"}
+
+_backend = "numpy"
+
+
+def backend_available(name: str):
+    """
+    Check whether the optional dependency of a backend can be imported.
+
+    Args:
+        name (str): Name of the backend.
+
+    Returns:
+        bool: True if the backend can be used.
+    """
+    module = REQUIREMENTS.get(name)
+    if module is None:
+        return True
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+def set_backend(name: str):
+    """
+    Select the implementation of the daily infection and timer steps.
+
+    "numpy" runs vectorized NumPy code over the edges leaving the infectious individuals.
+    "numba" runs the same steps as compiled loops, with those edges gathered in parallel, and
+    gives the same results for the same random stream. "sparse" keeps the contact graph as a
+    SciPy CSR matrix and computes the infection pressure on everyone with one sparse
+    matrix-vector product per day. If the module a backend needs is not installed, a warning
+    is issued and the NumPy backend is used instead.
+
+    The choice is stored in the EPIDEMICS_BACKEND environment variable, which is also read
+    on import, so worker processes started by `run_ensemble` and `run_sweep` use it too.
+
+    Args:
+        name (str): "numpy", "numba" or "sparse".
+
+    Raises:
+        ValueError: If the name is not a known backend.
+    """
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name!r}, expected one of {BACKENDS}")
+    if not backend_available(name):
+        warnings.warn(
+            f"{REQUIREMENTS[name]} is not installed, using the NumPy backend",
+            RuntimeWarning,
+        )
+        name = "numpy"
+    _backend = name
+    os.environ["EPIDEMICS_BACKEND"] = name
+
+
+def get_backend():
+    """
+    The selected backend.
+
+    Returns:
+        str: "numpy", "numba" or "sparse".
+    """
+    return _backend
+
+
+set_backend(os.environ.get("EPIDEMICS_BACKEND", "numpy"))
@@ -0,0 +1,225 @@
+import numpy as np
+
+from .population import INFECTED, STATE_LABELS, SUSCEPTIBLE, Population
+from .spatial import NeighbourGraph, expand_ranges
+
+
+class BatchPopulation(Population):
+    """
+    K independent replicas of one population, advanced together.
+
+    Every per-individual array has K * N entries laid out replica by replica, so each one is a
+    (K, N) array viewed flat: individual j of replica k has index k * N + j. All replicas share
+    the placement of one layout. Transitions and infections run on the flat arrays unchanged.
+
+    Replicas whose epidemic is over are frozen: `current` leaves their members out, so they
+    keep their final state while the others carry on, as if each had stopped on its own.
+
+    Args:
+        size (int): Number of individuals per replica.
+        replicas (int): Number of replicas.
+        beta (float): Initial infection transmission rate of every individual.
+        ongoing (tuple[int]): State codes that keep a replica running while occupied.
+
+    Attributes:
+        size (int): Number of individuals per replica.
+        replicas (int): Number of replicas.
+        ongoing (list[int]): State codes that keep a replica running while occupied.
+        replica_tally (np.ndarray): Running number of individuals per replica and state code,
+                                    of shape (replicas, states), kept up to date by `move`.
+
+        See `Population` for the per-individual arrays and the overall `tally`.
+    """
+
+    def __init__(
+        self, size: int, replicas: int, beta: float = 0.0, ongoing=(INFECTED,)
+    ):
+        super().__init__(size * replicas, beta)
+        self.size = size
+        self.replicas = replicas
+        self.ongoing = list(ongoing)
+        self.replica_tally = np.zeros((replicas, len(STATE_LABELS)), dtype=np.int64)
+        self.replica_tally[:, SUSCEPTIBLE] = size
+
+    @classmethod
+    def from_layout(cls, layout, beta: float, replicas: int = 1, ongoing=(INFECTED,)):
+        """
+        Create K susceptible replicas placed according to a layout.
+
+        Args:
+            layout (Layout): Placement shared by every replica.
+            beta (float): Initial infection transmission rate of every individual.
+            replicas (int): Number of replicas.
+            ongoing (tuple[int]): State codes that keep a replica running while occupied.
+
+        Returns:
+            BatchPopulation: The new population.
+        """
+        population = cls(len(layout), replicas, beta, ongoing)
+        population.x = np.tile(layout.x, replicas)
+        population.y = np.tile(layout.y, replicas)
+        return population
+
+    def seed_infections(self, count: int, rng):
+        """
+        Move `count` randomly chosen individuals of every replica to the infected state.
+
+        Args:
+            count (int): Number of individuals to infect per replica.
+            rng (np.random.Generator): Random number generator used for sampling.
+
+        Returns:
+            np.ndarray: Flat indices of the infected individuals.
+        """
+        chosen = np.concatenate(
+            [
+                replica * self.size + rng.choice(self.size, size=count, replace=False)
+                for replica in range(self.replicas)
+            ]
+        )
+        self.move(chosen, INFECTED)
+        return chosen
+
+    def move(self, indices, target: int):
+        """
+        Move individuals to a new state, updating the overall and per-replica counts.
+
+        Args:
+            indices (np.ndarray): Distinct flat indices of the individuals to move.
+            target (int): State code to move them to.
+        """
+        replica = indices // self.size
+        states = len(STATE_LABELS)
+        self.replica_tally -= np.bincount(
+            replica * states + self.state[indices], minlength=self.replicas * states
+        ).reshape(self.replicas, states)
+        self.replica_tally[:, target] += np.bincount(replica, minlength=self.replicas)
+        super().move(indices, target)
+
+    def members_alongside(self, indices, code: int):
+        """
+        Count the members of a state in the replica of each of the given individuals.
+
+        Args:
+            indices (np.ndarray): Flat indices of the individuals.
+            code (int): State code to count.
+
+        Returns:
+            int: Number of members of `code` summed over the individuals.
+        """
+        return int(self.replica_tally[indices // self.size, code].sum())
+
+    def running(self):
+        """
+        Which replicas still have individuals in an ongoing state.
+
+        Returns:
+            np.ndarray: Boolean mask over the replicas.
+        """
+        return self.replica_tally[:, self.ongoing].any(axis=1)
+
+    def current(self, code: int):
+        """
+        Members of a tracked state in the replicas that are still running.
+
+        Args:
+            code (int): State code enabled by `track`.
+
+        Returns:
+            np.ndarray: Flat indices of the members.
+        """
+        members = self.active[code]
+        running = self.running()
+        if running.all():
+            return members
+        return members[running[members // self.size]]
+
+
+class ReplicatedGraph(NeighbourGraph):
+    """
+    Contact graph of K replicas that share one placement, without copying its neighbour lists.
+
+    Individual j of replica k, at flat index k * N + j, has the neighbours of j in `graph`,
+    shifted into replica k. `edges` reads the shared lists directly. The flat `indptr` and
+    `indices` of the whole block-diagonal graph are only built if a backend asks for them.
+
+    Args:
+        graph (NeighbourGraph): Contact graph of one replica.
+        replicas (int): Number of replicas.
+
+    Attributes:
+        graph (NeighbourGraph): Contact graph of one replica.
+        replicas (int): Number of replicas.
+    """
+
+    def __init__(self, graph, replicas: int):
+        self.graph = graph
+        self.replicas = replicas
+        self._flat = None
+        self._matrices = {}
+
+    def _flatten(self):
+        if self._flat is None:
+            size, edges = len(self.graph), self.graph.edge_count
+            replica = np.arange(self.replicas, dtype=np.int64)
+            indptr = np.empty(size * self.replicas + 1, dtype=np.int64)
+            indptr[:-1] = (self.graph.indptr[:-1] + edges * replica[:, None]).ravel()
+            indptr[-1] = edges * self.replicas
+            indices = (self.graph.indices + size * replica[:, None]).ravel()
+            self._flat = (indptr, indices)
+        return self._flat
+
+    @property
+    def indptr(self):
+        """Offset of each flat index's neighbour list, with a trailing end offset."""
+        return self._flatten()[0]
+
+    @property
+    def indices(self):
+        """Concatenated neighbour lists, as flat indices."""
+        return self._flatten()[1]
+
+    def __len__(self):
+        return len(self.graph) * self.replicas
+
+    @property
+    def edge_count(self):
+        """Number of directed edges in the graph."""
+        return self.graph.edge_count * self.replicas
+
+    def count_edges(self, sources):
+        """
+        Count the edges leaving `sources`.
+
+        Args:
+            sources (np.ndarray): Flat indices of the source points.
+
+        Returns:
+            int: Total number of neighbours of the sources.
+        """
+        return self.graph.count_edges(np.asarray(sources) % len(self.graph))
+
+    def edges(self, sources, mask=None):
+        """
+        List the edges leaving `sources`, optionally keeping only targets selected by `mask`.
+
+        Args:
+            sources (np.ndarray): Flat indices of the source points.
+            mask (np.ndarray, optional): Boolean array over the flat indices selecting the allowed targets.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Source and target flat index of every edge.
+        """
+        sources = np.asarray(sources, dtype=np.intp)
+        replica, local = np.divmod(sources, len(self.graph))
+        start = self.graph.indptr[local]
+        lengths = self.graph.indptr[local + 1] - start
+
+        targets = self.graph.indices[expand_ranges(start, lengths)] + np.repeat(
+            replica * len(self.graph), lengths
+        )
+        sources = np.repeat(sources, lengths)
+        if mask is not None:
+            keep = mask[targets]
+            sources, targets = sources[keep], targets[keep]
+        return sources, targets
@@ -0,0 +1,313 @@
+"""
+Benchmark suite timing headless runs of every model across population sizes.
+
+Run it from the repository root, e.g.
+
+    python -m epidemics.benchmark --sizes 1000 10000 --output before.json
+    python -m epidemics.benchmark --sizes 1000 10000 --output after.json
+    python -m epidemics.benchmark --compare before.json after.json
+"""
+
+import argparse
+import importlib
+import json
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .backend import get_backend
+from .layout import Layout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Directory and module of every model, relative to the repository root
+MODELS = {
+    "SIR": ("SIR", "sir"),
+    "SEIRS": ("SEIRS", "seirs"),
+    "SEIRD": ("SEIRD", "seird"),
+}
+
+# Population sizes benchmarked by default
+BENCHMARK_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+# Population of the default 800 x 600 area, whose density every benchmark keeps
+REFERENCE_POPULATION = 1500
+
+
+def load_model(name: str):
+    """
+    Import a model class by name.
+
+    Args:
+        name (str): "SIR", "SEIRS" or "SEIRD".
+
+    Returns:
+        type: The model class.
+    """
+    directory, module = MODELS[name]
+    path = os.path.join(ROOT, directory)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    return getattr(importlib.import_module(module), name)
+
+
+def scaled_area(size: int, width: int = 800, height: int = 600):
+    """
+    Area holding `size` individuals at the density of the default models.
+
+    Benchmarks grow the area with the population, so that every individual has as many
+    contacts as in a default run and the cost per individual stays comparable across sizes.
+
+    Args:
+        size (int): Population size.
+        width (int): Width of the default area.
+        height (int): Height of the default area.
+
+    Returns:
+        tuple[int, int]: Width and height of the scaled area.
+    """
+    scale = math.sqrt(size / REFERENCE_POPULATION)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _peak_rss():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def run_case(
+    name: str,
+    size: int,
+    seed: int,
+    max_days: int = None,
+    initial_infected: int = None,
+):
+    """
+    Time one headless run of a model.
+
+    Args:
+        name (str): Model name.
+        size (int): Population size.
+        seed (int): Seed of the run.
+        max_days (int, optional): Maximum number of days. Defaults to the model's default.
+        initial_infected (int, optional): Initial number of infected individuals. Defaults to
+                                          the model's default.
+
+    Returns:
+        dict: Timings, peak RSS and work measures of the run.
+    """
+    model = load_model(name)
+    baseline = _peak_rss()
+    width, height = scaled_area(size)
+    parameters = {"population": size, "width": width, "height": height, "seed": seed}
+    if max_days is not None:
+        parameters["max_days"] = max_days
+    if initial_infected is not None:
+        parameters["initial_infected"] = initial_infected
+    simulation = model(**parameters)
+
+    start = time.perf_counter()
+    layout = Layout.generate(
+        size,
+        width,
+        height,
+        simulation.PROXIMITY,
+        simulation.rng,
+        simulation.PLACEMENT,
+    )
+    setup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    simulation.simulate(verbose=False, layout=layout, count_operations=True)
+    wall = time.perf_counter() - start
+
+    days = max(simulation.day, 1)
+    totals = simulation.operations.totals()
+    return {
+        "model": name,
+        "size": size,
+        "width": width,
+        "height": height,
+        "seed": seed,
+        "initial_infected": simulation.INITIAL_INFECTED,
+        "days": simulation.day,
+        "setup_time": setup,
+        "wall_time": wall,
+        "day_time": wall / days,
+        "peak_rss_mb": _peak_rss(),
+        # Peak RSS above the interpreter and its imports
+        "memory_mb": _peak_rss() - baseline,
+        "contact_edges": layout.neighbours.edge_count,
+        # Distances are only computed while building the contact graph; every day then scans
+        # the contact lists of the infectious individuals
+        "contact_checks_per_day": totals["contact_checks"] / days,
+        "all_pairs_checks_per_day": totals["all_pairs_checks"] / days,
+        "random_draws_per_day": totals["random_draws"] / days,
+    }
+
+
+def _run_case(task):
+    return run_case(*task)
+
+
+def environment():
+    """
+    Describe the machine and code version a benchmark ran on.
+
+    Returns:
+        dict: Git commit, Python, NumPy, platform, CPU count and backend.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "backend": get_backend(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def run_benchmarks(
+    models=tuple(MODELS),
+    sizes=BENCHMARK_SIZES,
+    repeats: int = 1,
+    seed: int = 0,
+    max_days: int = None,
+    output: str = None,
+    infected_share: float = 15 / REFERENCE_POPULATION,
+):
+    """
+    Benchmark every model at every population size.
+
+    Like the area, the initial number of infected grows with the population, so every size
+    runs an epidemic of the same relative size. Each run happens in a fresh process, so its
+    peak RSS is its own. Repeats of a case use the same seed; the fastest is kept.
+
+    Args:
+        models (tuple[str]): Model names.
+        sizes (tuple[int]): Population sizes.
+        repeats (int): Number of runs per case.
+        seed (int): Seed of every run.
+        max_days (int, optional): Maximum number of days per run.
+        output (str, optional): Path of a JSON file to write the results to.
+        infected_share (float): Initial share of infected individuals. Defaults to the models'
+                                15 in 1500.
+
+    Returns:
+        dict: The environment and one result per (model, size) case.
+    """
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for name in models:
+        for size in sizes:
+            infected = max(1, round(size * infected_share))
+            runs = []
+            for _ in range(repeats):
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    runs.append(
+                        executor.submit(
+                            _run_case, (name, size, seed, max_days, infected)
+                        ).result()
+                    )
+            best = min(runs, key=lambda run: run["wall_time"])
+            best["wall_times"] = [run["wall_time"] for run in runs]
+            results.append(best)
+            print(
+                f"{name:>5} N={size:<8} I0={infected:<6} {best['wall_time']:9.3f} s "
+                f"{best['day_time'] * 1e3:9.3f} ms/day {best['peak_rss_mb']:9.1f} MB"
+            )
+
+    report = {"environment": environment(), "results": results}
+    if output is not None:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+    return report
+
+
+def compare(before: str, after: str):
+    """
+    Compare two benchmark reports case by case.
+
+    Args:
+        before (str): Path of the baseline report.
+        after (str): Path of the new report.
+
+    Returns:
+        list[dict]: Wall time, per-day time and peak RSS ratios (after / before) of every case
+                    present in both reports.
+    """
+    with open(before) as file:
+        old = {(run["model"], run["size"]): run for run in json.load(file)["results"]}
+    with open(after) as file:
+        new = {(run["model"], run["size"]): run for run in json.load(file)["results"]}
+
+    rows = []
+    for key in sorted(old.keys() & new.keys()):
+        rows.append(
+            {
+                "model": key[0],
+                "size": key[1],
+                "wall_time": new[key]["wall_time"] / old[key]["wall_time"],
+                "day_time": new[key]["day_time"] / old[key]["day_time"],
+                "peak_rss_mb": new[key]["peak_rss_mb"] / old[key]["peak_rss_mb"],
+            }
+        )
+        print(
+            f"{key[0]:>5} N={key[1]:<8} wall x{rows[-1]['wall_time']:.2f} "
+            f"per day x{rows[-1]['day_time']:.2f} RSS x{rows[-1]['peak_rss_mb']:.2f}"
+        )
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--models", nargs="+", default=list(MODELS), choices=MODELS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(BENCHMARK_SIZES))
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-days", type=int, default=None)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument(
+        "--infected-share", type=float, default=15 / REFERENCE_POPULATION
+    )
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two reports"
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+    else:
+        run_benchmarks(
+            args.models,
+            args.sizes,
+            args.repeats,
+            args.seed,
+            args.max_days,
+            args.output,
+            args.infected_share,
+        )
+
+
+if __name__ == "__main__":
+    main()
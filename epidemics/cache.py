@@ -0,0 +1,252 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from .layout import Layout
+from .placement import placement_key
+from .spatial import NeighbourGraph
+
+# Bumped whenever the layout or the format of an entry changes, invalidating older entries
+CACHE_VERSION = 1
+
+# Default maximum size of the cache directory, in bytes
+CACHE_SIZE = 2 << 30
+
+# Arrays stored in every entry, as <name>.npy
+LAYOUT_ARRAYS = ("x", "y", "indptr", "indices", "pending")
+
+_cache = None
+
+
+class LayoutCache:
+    """
+    Content-addressed directory of layouts, so runs with the same geometry skip their setup.
+
+    A layout is fully determined by the population size, the area, the contact radius, the
+    placement and the state of the random stream it is generated from. Their SHA-256 digest
+    names an entry holding the coordinates and the neighbour CSR arrays as `.npy` files, which
+    are memory-mapped when loaded instead of being read into memory. An entry also stores the
+    state of the stream after generation, so a run that loads its layout continues with the
+    same random numbers as a run that generates it, and both give the same results.
+
+    Entries are written to a temporary directory and renamed into place, so concurrent workers
+    never read a partial entry. Once the entries exceed `max_bytes`, the least recently used
+    ones are removed.
+
+    Args:
+        directory (str): Directory holding the entries, created if missing.
+        max_bytes (int): Maximum total size of the entries.
+
+    Attributes:
+        directory (str): Directory holding the entries.
+        max_bytes (int): Maximum total size of the entries.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = CACHE_SIZE):
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(
+        self,
+        size: int,
+        width: int,
+        height: int,
+        proximity: float,
+        rng,
+        placement="uniform",
+    ):
+        """
+        Digest of everything a layout depends on.
+
+        Args:
+            size (int): Number of individuals.
+            width (int): Width of the simulation area.
+            height (int): Height of the simulation area.
+            proximity (float): Contact radius.
+            rng (RandomStream): Random number stream the layout is generated from.
+            placement (str | dict): Placement specification, see `resolve_placement`.
+
+        Returns:
+            str: Hexadecimal SHA-256 digest naming the entry.
+        """
+        state = rng.get_state()
+        digest = hashlib.sha256()
+        digest.update(
+            json.dumps([CACHE_VERSION, size, width, height, float(proximity)]).encode()
+        )
+        digest.update(placement_key(placement).encode())
+        digest.update(json.dumps(state["generator"], sort_keys=True).encode())
+        digest.update(state["pending"].tobytes())
+        return digest.hexdigest()
+
+    def layout(
+        self,
+        size: int,
+        width: int,
+        height: int,
+        proximity: float,
+        rng,
+        placement="uniform",
+    ):
+        """
+        Load a layout from the cache, or generate and store it.
+
+        Either way, `rng` is left where generating the layout leaves it.
+
+        Args:
+            size (int): Number of individuals.
+            width (int): Width of the simulation area.
+            height (int): Height of the simulation area.
+            proximity (float): Contact radius.
+            rng (RandomStream): Random number stream the layout is generated from.
+            placement (str | dict): Placement specification, see `resolve_placement`.
+
+        Returns:
+            Layout: The layout, with read-only memory-mapped arrays if it was loaded.
+        """
+        key = self.key(size, width, height, proximity, rng, placement)
+        path = os.path.join(self.directory, key)
+        if os.path.isdir(path):
+            return self._load(path, proximity, rng)
+
+        layout = Layout.generate(size, width, height, proximity, rng, placement)
+        self._store(path, layout, rng)
+        self.evict()
+        return layout
+
+    def _load(self, path: str, proximity: float, rng):
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+            for name in LAYOUT_ARRAYS
+        }
+        with open(os.path.join(path, "generator.json")) as file:
+            generator = json.load(file)
+        rng.set_state({"generator": generator, "pending": arrays["pending"]})
+        # Mark the entry as recently used
+        os.utime(path)
+
+        neighbours = NeighbourGraph(arrays["indptr"], arrays["indices"])
+        return Layout(arrays["x"], arrays["y"], neighbours, proximity)
+
+    def _store(self, path: str, layout, rng):
+        state = rng.get_state()
+        arrays = {
+            "x": layout.x,
+            "y": layout.y,
+            "indptr": layout.neighbours.indptr,
+            "indices": layout.neighbours.indices,
+            "pending": state["pending"],
+        }
+        staging = tempfile.mkdtemp(dir=self.directory, prefix=".staging-")
+        for name, array in arrays.items():
+            np.save(os.path.join(staging, f"{name}.npy"), array)
+        with open(os.path.join(staging, "generator.json"), "w") as file:
+            json.dump(state["generator"], file)
+        try:
+            os.rename(staging, path)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def entries(self):
+        """
+        List the entries, least recently used first.
+
+        Returns:
+            list[tuple[str, int]]: Path and size in bytes of every entry.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith(".") or not os.path.isdir(path):
+                continue
+            files = [os.path.join(path, file) for file in os.listdir(path)]
+            size = sum(os.path.getsize(file) for file in files)
+            entries.append((os.path.getmtime(path), path, size))
+        entries.sort()
+        return [(path, size) for _, path, size in entries]
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits in `max_bytes`.
+        """
+        entries = self.entries()
+        total = sum(size for _, size in entries)
+        for path, size in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """
+        Remove every entry.
+        """
+        for path, _ in self.entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def set_cache(directory: str = None, max_bytes: int = CACHE_SIZE):
+    """
+    Cache the layouts of seeded runs in a directory, or stop caching them.
+
+    The choice is stored in the EPIDEMICS_CACHE and EPIDEMICS_CACHE_SIZE environment variables,
+    which are also read on import, so worker processes started by `run_ensemble` and
+    `run_sweep` use the cache too.
+
+    Args:
+        directory (str, optional): Cache directory. None disables the cache.
+        max_bytes (int): Maximum total size of the cached layouts.
+    """
+    global _cache
+    if directory is None:
+        _cache = None
+        os.environ.pop("EPIDEMICS_CACHE", None)
+        return
+    _cache = LayoutCache(directory, max_bytes)
+    os.environ["EPIDEMICS_CACHE"] = directory
+    os.environ["EPIDEMICS_CACHE_SIZE"] = str(max_bytes)
+
+
+def get_cache():
+    """
+    The layout cache in use.
+
+    Returns:
+        LayoutCache | None: The cache, or None when layouts are not cached.
+    """
+    return _cache
+
+
+def cached_layout(
+    size: int, width: int, height: int, proximity: float, rng, placement="uniform"
+):
+    """
+    Generate a layout, going through the layout cache for seeded streams when it is enabled.
+
+    Args:
+        size (int): Number of individuals.
+        width (int): Width of the simulation area.
+        height (int): Height of the simulation area.
+        proximity (float): Contact radius.
+        placement (str | dict): Placement specification, see `resolve_placement`.
+        rng (RandomStream): Random number stream the layout is generated from.
+
+    Returns:
+        Layout: The layout.
+    """
+    if _cache is None or not rng.seeded:
+        return Layout.generate(size, width, height, proximity, rng, placement)
+    return _cache.layout(size, width, height, proximity, rng, placement)
+
+
+if os.environ.get("EPIDEMICS_CACHE"):
+    set_cache(
+        os.environ["EPIDEMICS_CACHE"],
+        int(os.environ.get("EPIDEMICS_CACHE_SIZE", CACHE_SIZE)),
+    )
@@ -0,0 +1,387 @@
+from .batch import BatchPopulation, ReplicatedGraph
+from .individual import COLOR_CODES, IndividualViews
+from .cache import cached_layout
+from .placement import resolve_placement
+from .population import (
+    DEAD,
+    EXPOSED,
+    IMMUNE,
+    INFECTED,
+    PALETTE,
+    RECOVERED,
+    STATE_CODES,
+    STATE_LABELS,
+    SUSCEPTIBLE,
+    Population,
+)
+from .profiling import OperationCounts, PhaseProfile
+from .result import SimulationResult
+from .rng import RandomStream
+from .transitions import compile_transitions
+from .visualization import LiveView
+
+# Legend label of every state code in plots
+STATE_NAMES = ("Susceptible", "Exposed", "Infected", "Recovered", "Dead", "Immune")
+
+
+def _skip(phase):
+    # Stands in for PhaseProfile.lap when a run is not profiled
+    pass
+
+
+class CompartmentModel:
+    """
+    Spatial stochastic compartment model, the engine shared by SIR, SEIRS and SEIRD.
+
+    The engine owns everything the models have in common: placing the population and building
+    its contact graph, seeding infections, the daily loop with its live view, recording and
+    progress output, and plotting. A model is a subclass that declares its compartments and
+    transitions in the class attributes below; the transitions are compiled into vectorized
+    kernels once per model class.
+
+    Args:
+        population (int): Total population size.
+        initial_infected (int): Initial number of infected individuals.
+        beta (float): Infection transmission rate.
+        proximity (int): Proximity threshold for infection transmission.
+        max_days (int): Maximum number of simulation days.
+        width (int): Width of the simulation visualization.
+        height (int): Height of the simulation visualization.
+        seed (int | np.random.SeedSequence, optional): Seed of the random stream. Runs with the
+                                                       same seed are bit-identical.
+        placement (str | dict): Placement of the population, a name from PLACEMENTS or a dict
+                                with the name under "kind" and the placement's options.
+
+    Class attributes:
+        NAME (str): Model name used in captions and plot titles.
+        COMPARTMENTS (tuple[int]): State codes recorded every day, in result column order.
+        TRANSITIONS (tuple[Transition | Infection]): Steps applied every day, in order.
+        ONGOING (tuple[int]): State codes that keep the simulation running while occupied.
+        PARAMETERS (tuple[str]): Model-specific rate attributes shown in plot titles.
+
+    Attributes:
+        POPULATION_SIZE (int): Total population size.
+        INITIAL_INFECTED (int): Initial number of infected individuals.
+        PROXIMITY (int): Proximity threshold for infection transmission.
+        MAX_DAYS (int): Maximum number of simulation days.
+        PLACEMENT (str | dict): Placement of the population.
+        BETA (float): Infection transmission rate.
+        population (Population): Array-backed store of the simulated individuals.
+        neighbours (NeighbourGraph): Pairs of individuals within PROXIMITY, built once per run.
+        individuals (IndividualViews): Views of the population members as Individual objects.
+        infected_individuals (np.ndarray): Indices of the initially infected individuals.
+        rng (RandomStream): Random number stream driving the simulation.
+        day (int): Current simulation day.
+        result (SimulationResult): Daily compartment counts of the last run.
+        profile (PhaseProfile | None): Time and calls per phase and day of the last run, if
+                                       it was profiled.
+        operations (OperationCounts | None): Work done per day in the last run, if it was counted.
+        COLOR_CODES (dict): Dictionary mapping states to RGB color codes.
+        WIDTH (int): Width of the simulation visualization.
+        HEIGHT (int): Height of the simulation visualization.
+    """
+
+    NAME = None
+    COMPARTMENTS = ()
+    TRANSITIONS = ()
+    ONGOING = ()
+    PARAMETERS = ()
+
+    def __init__(
+        self,
+        population: int = 1500,
+        initial_infected: int = 15,
+        beta: float = 0.1,
+        proximity: int = 30,
+        max_days: int = 1000,
+        width: int = 800,
+        height: int = 600,
+        seed=None,
+        placement="uniform",
+    ):
+        resolve_placement(placement)
+        self.POPULATION_SIZE = population
+        self.INITIAL_INFECTED = initial_infected
+        self.PROXIMITY = proximity
+        self.MAX_DAYS = max_days
+        self.PLACEMENT = placement
+
+        self.BETA = beta
+
+        self.population = None
+        self.neighbours = None
+        self.infected_individuals = []
+        self.rng = RandomStream(seed)
+
+        self.day = 0
+
+        self.result = SimulationResult(self.COMPARTMENTS, 0)
+        self.profile = None
+        self.operations = None
+
+        self.COLOR_CODES = {
+            STATE_LABELS[code]: COLOR_CODES[STATE_LABELS[code]]
+            for code in self.COMPARTMENTS
+        }
+
+        # Pygame variables
+        self.WIDTH = width
+        self.HEIGHT = height
+
+    @property
+    def individuals(self):
+        """
+        Individual objects viewing the members of the current population.
+
+        The simulation runs on the array-backed `population`; this is a lazy sequence of
+        lightweight views of its members for code written against the object API. A view is
+        only created when an element is accessed. The views read the population as it is now,
+        and changes made through them are changes to the simulation.
+        """
+        if self.population is None:
+            return []
+        return IndividualViews(self.population)
+
+    def _series(self, code: int):
+        if code not in self.COMPARTMENTS:
+            raise AttributeError(
+                f"{type(self).__name__} does not record {STATE_NAMES[code].lower()} counts"
+            )
+        return self.result.series(code)
+
+    @property
+    def s_data(self):
+        """Daily susceptible counts, a view of `result`."""
+        return self._series(SUSCEPTIBLE)
+
+    @property
+    def e_data(self):
+        """Daily exposed counts, a view of `result`."""
+        return self._series(EXPOSED)
+
+    @property
+    def i_data(self):
+        """Daily infected counts, a view of `result`."""
+        return self._series(INFECTED)
+
+    @property
+    def r_data(self):
+        """Daily recovered counts, a view of `result`."""
+        return self._series(RECOVERED)
+
+    @property
+    def d_data(self):
+        """Daily deceased counts, a view of `result`."""
+        return self._series(DEAD)
+
+    @property
+    def immune_data(self):
+        """Daily immune counts, a view of `result`."""
+        return self._series(IMMUNE)
+
+    def _operation(self, name: str):
+        if self.operations is None:
+            raise AttributeError(
+                "Operations were not counted, run simulate(count_operations=True)"
+            )
+        return self.operations.series(name)
+
+    @property
+    def contact_checks_data(self):
+        """Daily contacts examined by the infection steps, a view of `operations`."""
+        return self._operation("contact_checks")
+
+    @property
+    def all_pairs_checks_data(self):
+        """Daily distance checks the original loop would have made, spreaders x susceptibles."""
+        return self._operation("all_pairs_checks")
+
+    @property
+    def random_draws_data(self):
+        """Daily uniform draws, a view of `operations`."""
+        return self._operation("random_draws")
+
+    @property
+    def infections_data(self):
+        """Daily new infections, a view of `operations`."""
+        return self._operation("infections")
+
+    @property
+    def transitions_data(self):
+        """Daily moves made by the transitions other than infection, a view of `operations`."""
+        return self._operation("transitions")
+
+    @classmethod
+    def compiled(cls):
+        """
+        The model's TRANSITIONS compiled into kernels, cached per model class.
+
+        Returns:
+            CompiledTransitions: The compiled transitions.
+        """
+        return compile_transitions(cls.TRANSITIONS)
+
+    def advance(self):
+        """
+        Apply one day of the model's TRANSITIONS to `population`.
+        """
+        self.compiled().advance(self)
+
+    def simulate(
+        self,
+        live_visualization: bool = False,
+        verbose: bool = True,
+        layout=None,
+        replicas: int = None,
+        profile: bool = False,
+        count_operations: bool = False,
+    ):
+        """
+        Run the simulation.
+
+        Args:
+            live_visualization (bool): Whether to visualize the simulation in real-time using Pygame.
+            verbose (bool): Whether to print the simulation progress every 10 days.
+            layout (Layout, optional): Placement and contact graph to reuse. Defaults to a new
+                                       PLACEMENT, taken from the layout cache if enabled.
+            replicas (int, optional): Run this many stochastic replicas of the layout at once, in one
+                                      `BatchPopulation`. `result` then has a replica axis.
+            profile (bool): Whether to time every phase of every day into `profile`.
+            count_operations (bool): Whether to count the work done every day into `operations`.
+
+        This method simulates the spread of an epidemic until no individual is left in an
+        ONGOING state or MAX_DAYS is reached, recording the compartment counts of every day.
+
+        Raises:
+            ValueError: If live visualization is requested for a batched run.
+        """
+
+        if live_visualization and replicas is not None:
+            raise ValueError(
+                "Live visualization shows a single run, not a batch of replicas"
+            )
+        if live_visualization:
+            view = LiveView(f"{self.NAME} Model Simulation", self.WIDTH, self.HEIGHT)
+            palette = PALETTE.copy()
+            for label, color in self.COLOR_CODES.items():
+                palette[STATE_CODES[label]] = color
+
+        if layout is None:
+            layout = cached_layout(
+                self.POPULATION_SIZE,
+                self.WIDTH,
+                self.HEIGHT,
+                self.PROXIMITY,
+                self.rng,
+                self.PLACEMENT,
+            )
+        layout.check(self.POPULATION_SIZE, self.PROXIMITY)
+
+        if replicas is None:
+            self.population = Population.from_layout(layout, self.BETA)
+            self.neighbours = layout.neighbours
+            recorded = self.population.tally
+        else:
+            self.population = BatchPopulation.from_layout(
+                layout, self.BETA, replicas, self.ONGOING
+            )
+            self.neighbours = ReplicatedGraph(layout.neighbours, replicas)
+            recorded = self.population.replica_tally
+        self.result = SimulationResult(self.COMPARTMENTS, self.MAX_DAYS + 1, replicas)
+        self.population.track(*self.compiled().tracked)
+        self.infected_individuals = self.population.seed_infections(
+            self.INITIAL_INFECTED, self.rng
+        )
+
+        tally = self.population.tally
+        ongoing = list(self.ONGOING)
+
+        self.operations = None
+        if count_operations:
+            self.operations = OperationCounts(self.MAX_DAYS + 1)
+
+        self.profile = None
+        if profile:
+            self.profile = PhaseProfile(
+                ["events", "members", *self.compiled().labels]
+                + ["draw", "flip", "record", "progress"],
+                self.MAX_DAYS + 1,
+            )
+            lap = self.profile.lap
+        else:
+            lap = _skip
+
+        while tally[ongoing].any() and self.day <= self.MAX_DAYS:
+            self.day += 1
+            if self.profile is not None:
+                self.profile.next_day()
+            if self.operations is not None:
+                self.operations.next_day()
+                draws = self.rng.draws
+
+            if live_visualization:
+                view.handle_events()
+                lap("events")
+
+            self.advance()
+
+            if self.operations is not None:
+                self.operations.add("random_draws", self.rng.draws - draws)
+
+            if live_visualization:
+                # Draw individuals with updated states
+                counts = " | ".join(
+                    f"{STATE_LABELS[code]}:{tally[code]}" for code in self.COMPARTMENTS
+                )
+                view.draw(
+                    self.population,
+                    f"{self.NAME} Model Simulation - {counts} | DAY: {self.day}",
+                    palette,
+                )
+                lap("draw")
+                view.flip()
+                lap("flip")
+
+            self.result.record(recorded)
+            lap("record")
+
+            if verbose and self.day % 10 == 0:
+                print(f"Day: {self.day}/{self.MAX_DAYS}")
+                lap("progress")
+
+        self.result.trim()
+        if self.profile is not None:
+            self.profile.trim()
+        if self.operations is not None:
+            self.operations.trim()
+
+    def plot_graph(self):
+        """
+        Plot the simulation results using Matplotlib.
+
+        This method creates a graph displaying the daily count of every recorded compartment.
+        """
+        import matplotlib.pyplot as plt
+
+        plt.style.use("seaborn-v0_8-whitegrid")
+
+        for code in self.COMPARTMENTS:
+            color = tuple(c / 255.0 for c in self.COLOR_CODES[STATE_LABELS[code]])
+            plt.plot(
+                self.result.series(code),
+                label=STATE_NAMES[code],
+                linewidth=2,
+                color=color,
+            )
+
+        rates = ", ".join(
+            f"{name.title()}={getattr(self, name)}" for name in self.PARAMETERS
+        )
+        plt.xlabel("Days")
+        plt.ylabel("Population")
+        plt.title(
+            f"{self.NAME} Epidemic Spreading Simulation with Proximity\n{rates}\nProximity={self.PROXIMITY}, Population_size={self.POPULATION_SIZE}, Initial infected={self.INITIAL_INFECTED}"
+        )
+        plt.legend()
+        plt.grid(True)
+        plt.show()
@@ -0,0 +1,128 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .rng import as_seed_sequence
+
+# Daily series recorded by the models, in the column order used by ensemble results
+COMPARTMENT_SERIES = ("s_data", "e_data", "i_data", "r_data", "d_data", "immune_data")
+
+
+def recorded_series(simulation):
+    """
+    List the compartment series recorded by a model instance, in ensemble column order.
+
+    Args:
+        simulation: A model instance.
+
+    Returns:
+        list[str]: Names of the recorded series.
+    """
+    return [name for name in COMPARTMENT_SERIES if hasattr(simulation, name)]
+
+
+def series_names(model):
+    """
+    List the compartment series recorded by a model, in ensemble column order.
+
+    Args:
+        model (type): Model class (SIR, SEIRS or SEIRD).
+
+    Returns:
+        list[str]: Names of the recorded series, e.g. ["s_data", "i_data", "r_data"] for SIR.
+    """
+    return recorded_series(model())
+
+
+def compartment_series(simulation):
+    """
+    Stack the daily compartment counts of a finished simulation into one array.
+
+    Args:
+        simulation: A model instance that has run `simulate()`.
+
+    Returns:
+        np.ndarray: Array of shape (days, compartments), columns in `series_names` order.
+    """
+    return simulation.result.counts
+
+
+def _run_replica(task):
+    model, parameters, seed = task
+    simulation = model(seed=seed, **parameters)
+    simulation.simulate(verbose=False)
+    return [compartment_series(simulation)]
+
+
+def _run_batch(task):
+    model, parameters, seed, count = task
+    simulation = model(seed=seed, **parameters)
+    simulation.simulate(verbose=False, replicas=count)
+    return list(simulation.result.counts.transpose(1, 0, 2))
+
+
+def run_ensemble(
+    model,
+    replicas: int,
+    processes: int = None,
+    seed=None,
+    batch_size: int = None,
+    **parameters,
+):
+    """
+    Run independent replicas of a model across a process pool.
+
+    Every replica gets its own random stream spawned from one `np.random.SeedSequence`,
+    so an ensemble is reproducible for a given `seed` regardless of the number of processes.
+    Runs that end early are padded with their final day so all replicas share one length.
+
+    With `batch_size`, replicas are advanced `batch_size` at a time in one batched simulation
+    (see `CompartmentModel.simulate`), which pays the per-day overhead once per batch. The
+    replicas of a batch share one placement and contact graph; the random streams then depend
+    on the batch size, but still not on the number of processes.
+
+    Args:
+        model (type): Model class (SIR, SEIRS or SEIRD).
+        replicas (int): Number of replicas to run.
+        processes (int, optional): Number of worker processes. Defaults to the number of CPUs;
+                                   1 runs every replica in the calling process.
+        seed (int | np.random.SeedSequence, optional): Root seed of the ensemble.
+        batch_size (int, optional): Number of replicas per batched simulation.
+        **parameters: Keyword arguments passed to the model constructor.
+
+    Returns:
+        np.ndarray: Array of shape (replicas, days, compartments) with the daily compartment
+                    counts of every replica, columns in `series_names(model)` order.
+    """
+    root = as_seed_sequence(seed)
+    if batch_size is None:
+        run = _run_replica
+        tasks = [(model, parameters, child) for child in root.spawn(replicas)]
+    else:
+        run = _run_batch
+        counts = [
+            min(batch_size, replicas - start)
+            for start in range(0, replicas, batch_size)
+        ]
+        tasks = [
+            (model, parameters, child, count)
+            for child, count in zip(root.spawn(len(counts)), counts)
+        ]
+
+    processes = processes or os.cpu_count()
+    if processes == 1:
+        results = [run(task) for task in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (processes * 4))
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(run, tasks, chunksize=chunksize))
+    results = [series for result in results for series in result]
+
+    days = max(len(result) for result in results)
+    stacked = np.zeros((replicas, days, results[0].shape[1]), dtype=np.int64)
+    for replica, result in enumerate(results):
+        stacked[replica, : len(result)] = result
+        if len(result):
+            stacked[replica, len(result) :] = result[-1]
+    return stacked
@@ -0,0 +1,189 @@
+import math
+import random
+from collections.abc import Sequence
+
+import numpy as np
+
+from .population import PALETTE, STATE_CODES, STATE_LABELS, Population
+
+# RGB colour of every state label, shared by the models and their individuals
+COLOR_CODES = {
+    label: tuple(PALETTE[code].tolist()) for code, label in enumerate(STATE_LABELS)
+}
+
+
+class Individual:
+    """
+    Represents an individual in the simulation.
+
+    The models simulate an array-backed `Population`; this class is the object view of one of
+    its members, kept for code written against the object API. An individual holds no data of
+    its own: every attribute reads and writes the population's arrays, and `__slots__` leaves
+    out the per-instance `__dict__`. An individual created directly is backed by a population
+    of one.
+
+    Args:
+        state (str): The current state of the individual ('S' for susceptible, 'E' for exposed,
+                     'I' for infected, 'R' for recovered, 'D' for dead, 'Immune' for immune).
+        beta (float): The infection transmission rate (optional, default: 0.0).
+        screen (pygame.Surface): The Pygame screen object for visualization (optional).
+        width (int): The width of the simulation visualization (optional, default: 800).
+        height (int): The height of the simulation visualization (optional, default: 600).
+        x (int): Fixed x-coordinate (optional, default: random position).
+        y (int): Fixed y-coordinate (optional, default: random position).
+
+    Attributes:
+        x (float): The x-coordinate of the individual, read-only.
+        y (float): The y-coordinate of the individual, read-only.
+        state (str): The current state of the individual.
+        exposed_duration (int): The number of days an individual has been exposed.
+        recovered_days (int): The number of days an individual has been in the recovered state.
+        modified_beta (float): The adjusted infection transmission rate based on interactions.
+        infection_count (int): Number of times the individual has been infected.
+        COLOR_CODES (dict): Dictionary mapping states to RGB color codes, shared by every individual.
+        screen (pygame.Surface): The Pygame screen object for visualization.
+        population (Population): Store holding the individual's attributes.
+        index (int): Position of the individual in `population`.
+    """
+
+    __slots__ = ("population", "index", "screen")
+
+    COLOR_CODES = COLOR_CODES
+
+    def __init__(
+        self,
+        state,
+        beta: float = 0.0,
+        screen=None,
+        width: int = 800,
+        height: int = 600,
+        x=None,
+        y=None,
+    ):
+        self.population = Population(1, beta)
+        self.index = 0
+        self.screen = screen
+        self.population.x[0] = random.randint(0, width) if x is None else x
+        self.population.y[0] = random.randint(0, height) if y is None else y
+        self.state = state
+
+    @classmethod
+    def view(cls, population, index: int, screen=None):
+        """
+        View one member of a population as an Individual.
+
+        Changes made through the view are changes to the population.
+
+        Args:
+            population (Population): Store holding the member.
+            index (int): Position of the member in the population.
+            screen (pygame.Surface): The Pygame screen object for visualization (optional).
+
+        Returns:
+            Individual: The view.
+        """
+        individual = cls.__new__(cls)
+        individual.population = population
+        individual.index = index
+        individual.screen = screen
+        return individual
+
+    @property
+    def x(self):
+        return float(self.population.x[self.index])
+
+    @property
+    def y(self):
+        return float(self.population.y[self.index])
+
+    @property
+    def state(self):
+        return STATE_LABELS[self.population.state[self.index]]
+
+    @state.setter
+    def state(self, label):
+        self.population.move(np.array([self.index]), STATE_CODES[label])
+
+    @property
+    def exposed_duration(self):
+        return int(self.population.exposed_days[self.index])
+
+    @exposed_duration.setter
+    def exposed_duration(self, days):
+        self.population.exposed_days[self.index] = days
+
+    @property
+    def recovered_days(self):
+        return int(self.population.recovered_days[self.index])
+
+    @recovered_days.setter
+    def recovered_days(self, days):
+        self.population.recovered_days[self.index] = days
+
+    @property
+    def modified_beta(self):
+        return float(self.population.beta[self.index])
+
+    @modified_beta.setter
+    def modified_beta(self, beta):
+        self.population.beta[self.index] = beta
+
+    @property
+    def infection_count(self):
+        return int(self.population.infection_count[self.index])
+
+    @infection_count.setter
+    def infection_count(self, count):
+        self.population.infection_count[self.index] = count
+
+    def draw(self):
+        """
+        Draw the individual as a colored circle on the Pygame screen.
+
+        This method uses the Pygame screen object and the individual's state to determine the color of the circle.
+        """
+        import pygame
+
+        color = self.COLOR_CODES[self.state]
+        pygame.draw.circle(self.screen, color, (int(self.x), int(self.y)), 5)
+
+    def distance_to(self, other_individual):
+        """
+        Calculate the Euclidean distance to another individual.
+
+        Args:
+            other_individual (Individual): The other individual to calculate the distance to.
+
+        Returns:
+            float: The Euclidean distance between this individual and the other individual.
+        """
+        return math.sqrt(
+            (self.x - other_individual.x) ** 2 + (self.y - other_individual.y) ** 2
+        )
+
+
+class IndividualViews(Sequence):
+    """
+    Read-only sequence of the members of a population as Individual objects.
+
+    Views are created when an element is accessed, so the sequence itself costs nothing to
+    build and `len` and indexing stay O(1) however large the population is.
+
+    Args:
+        population (Population): Store holding the members.
+    """
+
+    def __init__(self, population):
+        self.population = population
+
+    def __len__(self):
+        return len(self.population)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("individual index out of range")
+        return Individual.view(self.population, index)
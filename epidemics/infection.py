@@ -0,0 +1,185 @@
+import numpy as np
+
+from .backend import get_backend
+
+
+def infection_probability(neighbours, spreaders, beta, susceptible, order: str = None):
+    """
+    Compute the daily infection probability of every susceptible in contact with a spreader.
+
+    A susceptible with infectious neighbours j escapes infection only if every contact fails,
+    so its infection probability is 1 - prod(1 - beta_j). The product is accumulated in log
+    space over the contact graph, one term per edge, so the cost is proportional to the number
+    of edges leaving the spreaders rather than to the population size.
+
+    Args:
+        neighbours (NeighbourGraph): Contact graph of the population.
+        spreaders (np.ndarray): Indices of the individuals spreading the infection today.
+        beta (float | np.ndarray): Transmission rate shared by all spreaders, or per individual.
+        susceptible (np.ndarray): Boolean mask of the individuals that can be infected.
+        order (str, optional): "earlier" only counts spreaders with a lower index than the
+                               susceptible, "later" only those with a higher one.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Indices of the exposed susceptibles, in increasing order,
+                                       and their infection probability.
+    """
+    if get_backend() == "numba":
+        from .numba_kernels import infection_probability as compiled_probability
+
+        return compiled_probability(neighbours, spreaders, beta, susceptible, order)
+    if get_backend() == "sparse":
+        return sparse_infection_probability(
+            neighbours, spreaders, beta, susceptible, order
+        )
+
+    sources, targets = neighbours.edges(spreaders, susceptible)
+    if order is not None:
+        keep = sources < targets if order == "earlier" else sources > targets
+        sources, targets = sources[keep], targets[keep]
+
+    if np.ndim(beta) == 0:
+        # With a shared beta only the number of infectious contacts k matters
+        at_risk, contacts = np.unique(targets, return_counts=True)
+        probability = 1.0 - (1.0 - beta) ** contacts
+    else:
+        at_risk, target_index = np.unique(targets, return_inverse=True)
+        # A rate of 1 escapes with log(0) = -inf, i.e. a certain infection
+        with np.errstate(divide="ignore"):
+            log_escape = np.bincount(
+                target_index,
+                weights=np.log1p(-beta[sources].astype(np.float64)),
+                minlength=len(at_risk),
+            )
+        probability = -np.expm1(log_escape)
+
+    return at_risk, probability
+
+
+def sparse_infection_probability(
+    neighbours, spreaders, beta, susceptible, order: str = None
+):
+    """
+    Compute the same infection probabilities as `infection_probability` with sparse mat-vecs.
+
+    The contact graph is the fixed adjacency matrix A, so the number of infectious contacts of
+    every individual is A @ s and its log escape probability is A @ (s * log(1 - beta)), where s
+    indicates the spreaders. Each product touches every edge once, which suits large outbreaks
+    in large populations.
+
+    Args:
+        neighbours (NeighbourGraph): Contact graph of the population.
+        spreaders (np.ndarray): Indices of the individuals spreading the infection today.
+        beta (float | np.ndarray): Transmission rate shared by all spreaders, or per individual.
+        susceptible (np.ndarray): Boolean mask of the individuals that can be infected.
+        order (str, optional): "earlier" only counts spreaders with a lower index than the
+                               susceptible, "later" only those with a higher one.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Indices of the exposed susceptibles, in increasing order,
+                                       and their infection probability.
+    """
+    adjacency = neighbours.matrix(order)
+    spreading = np.zeros(len(susceptible), dtype=np.float64)
+    spreading[spreaders] = 1.0
+
+    contacts = adjacency @ spreading
+    at_risk = np.flatnonzero((contacts > 0) & susceptible)
+
+    if np.ndim(beta) == 0:
+        probability = 1.0 - (1.0 - beta) ** contacts[at_risk]
+    else:
+        with np.errstate(divide="ignore"):
+            spreading[spreaders] = np.log1p(-beta[spreaders].astype(np.float64))
+        log_escape = adjacency @ spreading
+        probability = -np.expm1(log_escape[at_risk])
+
+    return at_risk, probability
+
+
+def contact_checks(neighbours, spreaders, beta):
+    """
+    Count the contacts the selected backend examines for one infection step.
+
+    The NumPy and Numba backends visit the edges leaving the spreaders. The sparse backend
+    multiplies the whole adjacency matrix, once for a shared beta and twice for per-individual
+    rates, so it visits every edge of the graph each time.
+
+    Args:
+        neighbours (NeighbourGraph): Contact graph of the population.
+        spreaders (np.ndarray): Indices of the individuals spreading the infection today.
+        beta (float | np.ndarray): Transmission rate shared by all spreaders, or per individual.
+
+    Returns:
+        int: Number of contacts examined.
+    """
+    if get_backend() == "sparse":
+        return neighbours.edge_count * (1 if np.ndim(beta) == 0 else 2)
+    return neighbours.count_edges(spreaders)
+
+
+def infect(neighbours, spreaders, beta, susceptible, rng):
+    """
+    Decide which susceptibles get infected today, with one random draw per exposed susceptible.
+
+    Args:
+        neighbours (NeighbourGraph): Contact graph of the population.
+        spreaders (np.ndarray): Indices of the individuals spreading the infection today.
+        beta (float | np.ndarray): Transmission rate shared by all spreaders, or per individual.
+        susceptible (np.ndarray): Boolean mask of the individuals that can be infected.
+        rng (np.random.Generator): Random number generator for the infection draws.
+
+    Returns:
+        np.ndarray: Indices of the newly infected individuals.
+    """
+    at_risk, probability = infection_probability(
+        neighbours, spreaders, beta, susceptible
+    )
+    return at_risk[rng.random(len(at_risk)) < probability]
+
+
+def infect_in_order(neighbours, spreaders, beta, susceptible, rng, arrived=None):
+    """
+    Decide which susceptibles get infected today, and which of them before their own turn in a
+    sequential pass over the individuals in index order.
+
+    An individual is infected before its turn when a spreader with a lower index succeeds,
+    which happens with the probability `order="earlier"` of `infection_probability`, and
+    otherwise infected later in the pass with the probability `order="later"`. One draw per
+    exposed susceptible decides both, so this costs as many draws as `infect`, with the
+    probabilities computed by the selected backend.
+
+    Args:
+        neighbours (NeighbourGraph): Contact graph of the population.
+        spreaders (np.ndarray): Indices of the individuals spreading the infection today.
+        beta (float | np.ndarray): Transmission rate shared by all spreaders, or per individual.
+        susceptible (np.ndarray): Boolean mask of the individuals that can be infected.
+        rng (np.random.Generator): Random number generator for the infection draws.
+        arrived (np.ndarray, optional): Indices of susceptibles that only became susceptible at
+                                        their own turn today, so only spreaders with a higher
+                                        index can reach them.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Indices of the newly infected individuals, and of those
+                                       among them infected before their own turn.
+    """
+    earlier = susceptible
+    if arrived is not None and len(arrived):
+        earlier = susceptible.copy()
+        earlier[arrived] = False
+    early_risk, early = infection_probability(
+        neighbours, spreaders, beta, earlier, "earlier"
+    )
+    late_risk, late = infection_probability(
+        neighbours, spreaders, beta, susceptible, "later"
+    )
+
+    at_risk = np.union1d(early_risk, late_risk)
+    escape_early = np.ones(len(at_risk))
+    escape_early[np.searchsorted(at_risk, early_risk)] -= early
+    escape = escape_early.copy()
+    escape[np.searchsorted(at_risk, late_risk)] *= 1.0 - late
+
+    draws = rng.random(len(at_risk))
+    infected = draws < 1.0 - escape
+    return at_risk[infected], at_risk[draws < 1.0 - escape_early]
@@ -0,0 +1,78 @@
+from .placement import place
+from .spatial import NeighbourGraph
+
+
+class Layout:
+    """
+    Static placement of a population and the contact graph it induces.
+
+    Individuals never move, so a layout only depends on the population size, the size of the
+    simulation area, the placement and the contact radius. It can be built once and shared by every run that
+    uses the same geometry, whatever its epidemiological parameters.
+
+    Args:
+        x (np.ndarray): float32 x-coordinates.
+        y (np.ndarray): float32 y-coordinates.
+        neighbours (NeighbourGraph): Pairs of individuals within `proximity` of each other.
+        proximity (float): Contact radius the graph was built with.
+
+    Attributes:
+        x (np.ndarray): float32 x-coordinates.
+        y (np.ndarray): float32 y-coordinates.
+        neighbours (NeighbourGraph): Pairs of individuals within `proximity` of each other.
+        proximity (float): Contact radius the graph was built with.
+    """
+
+    def __init__(self, x, y, neighbours, proximity: float):
+        self.x = x
+        self.y = y
+        self.neighbours = neighbours
+        self.proximity = proximity
+
+    @classmethod
+    def generate(
+        cls,
+        size: int,
+        width: int,
+        height: int,
+        proximity: float,
+        rng,
+        placement="uniform",
+    ):
+        """
+        Place individuals with one of the PLACEMENTS and build their contact graph.
+
+        Args:
+            size (int): Number of individuals.
+            width (int): Width of the simulation area.
+            height (int): Height of the simulation area.
+            proximity (float): Contact radius.
+            rng (RandomStream): Random number stream used for placement.
+            placement (str | dict): Placement name, or a dict with the name under "kind" and the
+                                    placement's options, e.g. {"kind": "clustered", "cities": 4}.
+
+        Returns:
+            Layout: The new layout.
+        """
+        x, y = place(placement, size, width, height, rng)
+        return cls(x, y, NeighbourGraph.from_points(x, y, proximity), proximity)
+
+    def __len__(self):
+        return len(self.x)
+
+    def check(self, size: int, proximity: float):
+        """
+        Make sure the layout can be used by a simulation of the given size and contact radius.
+
+        Args:
+            size (int): Population size of the simulation.
+            proximity (float): Contact radius of the simulation.
+
+        Raises:
+            ValueError: If the layout was built for a different size or radius.
+        """
+        if len(self) != size or self.proximity != proximity:
+            raise ValueError(
+                f"Layout of {len(self)} individuals with proximity {self.proximity} "
+                f"does not match a population of {size} with proximity {proximity}"
+            )
@@ -0,0 +1,155 @@
+import math
+import random
+
+import numpy as np
+
+from .population import STATE_LABELS
+from .rng import as_seed_sequence
+
+
+class _Person:
+    # Attributes of the original per-object Individual, without its drawing
+    __slots__ = (
+        "x",
+        "y",
+        "state",
+        "exposed_duration",
+        "recovered_days",
+        "modified_beta",
+        "infection_count",
+    )
+
+    def __init__(self, beta: float, width: int, height: int, rng):
+        self.x = rng.randint(0, width)
+        self.y = rng.randint(0, height)
+        self.state = "S"
+        self.exposed_duration = 0
+        self.recovered_days = 0
+        self.modified_beta = beta
+        self.infection_count = 0
+
+    def distance_to(self, other):
+        return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
+
+
+def _sir_day(model, people, rng):
+    for person in people:
+        if person.state == "I":
+            if rng.random() < model.GAMMA:
+                person.state = "R"
+            else:
+                for other_person in people:
+                    if other_person.state == "S":
+                        distance = person.distance_to(other_person)
+                        if distance <= model.PROXIMITY and rng.random() < model.BETA:
+                            other_person.state = "I"
+
+
+def _seirs_day(model, people, rng):
+    for person in people:
+        if person.state == "E":
+            person.exposed_duration += 1
+            if person.exposed_duration >= model.SIGMA:
+                person.state = "I"
+                person.exposed_duration = 0
+        elif person.state == "I":
+            if rng.random() < model.GAMMA:
+                person.state = "R"
+            else:
+                person.modified_beta *= 1 - model.ALPHA
+                for other_person in people:
+                    if other_person.state == "S":
+                        distance = person.distance_to(other_person)
+                        if (
+                            distance <= model.PROXIMITY
+                            and rng.random() < person.modified_beta
+                        ):
+                            other_person.state = "E"
+        elif person.state == "R":
+            person.recovered_days += 1
+            if person.recovered_days >= model.MU:
+                person.state = "S"
+                person.recovered_days = 0
+
+
+def _seird_day(model, people, rng):
+    for person in people:
+        if person.state == "E":
+            person.exposed_duration += 1
+            if person.exposed_duration >= model.SIGMA:
+                person.state = "I"
+                person.exposed_duration = 0
+                person.infection_count += 1
+        elif person.state == "I":
+            if rng.random() < model.GAMMA:
+                if rng.random() < model.ETA:
+                    person.state = "D"
+                else:
+                    person.state = "R"
+            elif rng.random() < model.ETA:
+                person.state = "D"
+            else:
+                person.modified_beta *= 1 - model.ALPHA
+                for other_person in people:
+                    if other_person.state == "S":
+                        distance = person.distance_to(other_person)
+                        if (
+                            distance <= model.PROXIMITY
+                            and rng.random() < person.modified_beta
+                        ):
+                            other_person.state = "E"
+        elif person.state == "R":
+            # If person has been infected KAPPA times, it's immune
+            if person.infection_count >= model.KAPPA:
+                person.state = "Immune"
+            else:
+                person.recovered_days += 1
+                if person.recovered_days >= model.MU:
+                    person.state = "S"
+                    person.recovered_days = 0
+
+
+# Daily update of the original object loop of every model
+LEGACY_DAYS = {"SIR": _sir_day, "SEIRS": _seirs_day, "SEIRD": _seird_day}
+
+
+def run_legacy(simulation, seed=None):
+    """
+    Run the original per-object loop of a model, as a reference for the compiled engine.
+
+    This is the loop the models ran before the array-backed engine: a list of individuals
+    updated one after the other in place, each infectious individual testing its distance to
+    every susceptible, with Python's `random` module. Later individuals see the updates of
+    earlier ones on the same day. It costs O(I * N) distance checks per day, so it is only
+    meant for validation runs on small populations.
+
+    Args:
+        simulation (CompartmentModel): Model instance whose parameters are used; it is not run.
+        seed (int | np.random.SeedSequence, optional): Seed of the run.
+
+    Returns:
+        np.ndarray: int64 array of shape (days, compartments) with the daily counts of the
+                    model's COMPARTMENTS, like `SimulationResult.counts`.
+    """
+    day_update = LEGACY_DAYS[simulation.NAME]
+    rng = random.Random(int(as_seed_sequence(seed).generate_state(1)[0]))
+
+    people = [
+        _Person(simulation.BETA, simulation.WIDTH, simulation.HEIGHT, rng)
+        for _ in range(simulation.POPULATION_SIZE)
+    ]
+    for person in rng.sample(people, simulation.INITIAL_INFECTED):
+        person.state = "I"
+
+    labels = [STATE_LABELS[code] for code in simulation.COMPARTMENTS]
+    ongoing = {STATE_LABELS[code] for code in simulation.ONGOING}
+    counts = []
+    day = 0
+    while (
+        any(person.state in ongoing for person in people) and day <= simulation.MAX_DAYS
+    ):
+        day += 1
+        day_update(simulation, people, rng)
+        states = [person.state for person in people]
+        counts.append([states.count(label) for label in labels])
+    return np.array(counts, dtype=np.int64).reshape(-1, len(labels))
@@ -0,0 +1,113 @@
+"""Numba-compiled versions of the daily infection and timer steps, used by the "numba" backend."""
+
+import numba
+import numpy as np
+
+
+@numba.njit(parallel=True, cache=True)
+def _gather_edges(indptr, indices, spreaders, offsets, sources, targets):
+    # Every spreader writes its own slice of the edge arrays, so the loop is race-free
+    for k in numba.prange(len(spreaders)):
+        spreader = spreaders[k]
+        start = indptr[spreader]
+        for j in range(indptr[spreader + 1] - start):
+            sources[offsets[k] + j] = spreader
+            targets[offsets[k] + j] = indices[start + j]
+
+
+@numba.njit(cache=True)
+def _aggregate(sources, targets, susceptible, beta, shared_beta, order):
+    # order is 0 for every spreader, -1 for earlier ones only and 1 for later ones only
+    kept = 0
+    for edge in range(len(targets)):
+        if susceptible[targets[edge]] and (
+            order == 0
+            or (order < 0 and sources[edge] < targets[edge])
+            or (order > 0 and sources[edge] > targets[edge])
+        ):
+            sources[kept] = sources[edge]
+            targets[kept] = targets[edge]
+            kept += 1
+    sources = sources[:kept]
+    targets = targets[:kept]
+
+    # A stable sort keeps the edges of each target in spreader order, like the NumPy path
+    order = np.argsort(targets, kind="mergesort")
+    at_risk = np.empty(kept, dtype=np.int64)
+    contacts = np.zeros(kept, dtype=np.int64)
+    log_escape = np.zeros(kept, dtype=np.float64)
+    found = -1
+    for position in range(kept):
+        edge = order[position]
+        target = targets[edge]
+        if found < 0 or at_risk[found] != target:
+            found += 1
+            at_risk[found] = target
+        contacts[found] += 1
+        if not shared_beta:
+            log_escape[found] += np.log1p(-np.float64(beta[sources[edge]]))
+    return at_risk[: found + 1], contacts[: found + 1], log_escape[: found + 1]
+
+
+def infection_probability(neighbours, spreaders, beta, susceptible, order=None):
+    """
+    Numba version of `epidemics.infection.infection_probability`.
+
+    Edges leaving the spreaders are gathered in a parallel loop over the spreaders, then
+    aggregated per susceptible in one compiled pass.
+    """
+    spreaders = np.asarray(spreaders, dtype=np.int64)
+    lengths = neighbours.indptr[spreaders + 1] - neighbours.indptr[spreaders]
+    offsets = np.zeros(len(spreaders), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+
+    total = int(lengths.sum())
+    sources = np.empty(total, dtype=np.int64)
+    targets = np.empty(total, dtype=np.int64)
+    _gather_edges(
+        neighbours.indptr, neighbours.indices, spreaders, offsets, sources, targets
+    )
+
+    shared_beta = np.ndim(beta) == 0
+    beta_array = np.empty(0, dtype=np.float32) if shared_beta else beta
+    at_risk, contacts, log_escape = _aggregate(
+        sources,
+        targets,
+        susceptible,
+        beta_array,
+        shared_beta,
+        {None: 0, "earlier": -1, "later": 1}[order],
+    )
+    if shared_beta:
+        probability = 1.0 - (1.0 - beta) ** contacts
+    else:
+        probability = -np.expm1(log_escape)
+    return at_risk, probability
+
+
+@numba.njit(cache=True)
+def _tick(days, candidates, after):
+    moving = np.empty(len(candidates), dtype=candidates.dtype)
+    count = 0
+    for candidate in candidates:
+        days[candidate] += 1
+        if days[candidate] >= after:
+            days[candidate] = 0
+            moving[count] = candidate
+            count += 1
+    return moving[:count]
+
+
+def tick(days, candidates, after):
+    """
+    Advance the clock of every candidate by one day and reset the ones that reach `after`.
+
+    Args:
+        days (np.ndarray): Per-individual day counter, updated in place.
+        candidates (np.ndarray): Indices of the individuals whose clock runs.
+        after (float): Number of days before an individual moves.
+
+    Returns:
+        np.ndarray: Indices of the individuals whose timer expired.
+    """
+    return _tick(days, candidates, float(after))
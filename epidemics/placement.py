@@ -0,0 +1,270 @@
+import hashlib
+import math
+
+import numpy as np
+
+# Offsets of the 5x5 block of cells a Poisson-disk candidate is checked against
+DISK_OFFSETS = tuple((dx, dy) for dx in range(-2, 3) for dy in range(-2, 3))
+
+# Fraction of the area a saturated Poisson-disk set covers with disks of diameter `radius`
+DISK_PACKING = 0.547
+
+# Maximum number of passes over the empty cells while filling a Poisson-disk set
+DISK_ROUNDS = 64
+
+
+def uniform(size: int, width: int, height: int, rng):
+    """
+    Place individuals uniformly at random.
+
+    Coordinates are integers in [0, width] x [0, height], like the original per-object placement.
+
+    Args:
+        size (int): Number of individuals.
+        width (int): Width of the simulation area.
+        height (int): Height of the simulation area.
+        rng (RandomStream): Random number stream used for placement.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: float32 x- and y-coordinates.
+    """
+    x = rng.integers(0, width, size=size, endpoint=True).astype(np.float32)
+    y = rng.integers(0, height, size=size, endpoint=True).astype(np.float32)
+    return x, y
+
+
+def clustered(
+    size: int,
+    width: int,
+    height: int,
+    rng,
+    cities: int = 8,
+    spread: float = 0.05,
+    background: float = 0.1,
+):
+    """
+    Place individuals around Gaussian cities.
+
+    City centres are placed uniformly and given random shares of the population. Their residents
+    are scattered around the centre with a normal distribution; a `background` share of the
+    population lives uniformly spread over the countryside. Positions are clipped to the area.
+
+    Args:
+        size (int): Number of individuals.
+        width (int): Width of the simulation area.
+        height (int): Height of the simulation area.
+        rng (RandomStream): Random number stream used for placement.
+        cities (int): Number of cities.
+        spread (float): Standard deviation of a city, as a fraction of the smaller side of the area.
+        background (float): Share of the population placed uniformly.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: float32 x- and y-coordinates.
+    """
+    centre_x = rng.random(cities) * width
+    centre_y = rng.random(cities) * height
+    shares = rng.random(cities) + 1e-12
+    weights = (1 - background) * shares / shares.sum()
+
+    # The last "city" is the countryside
+    city = np.searchsorted(np.cumsum(np.append(weights, background)), rng.random(size))
+    city = np.minimum(city, cities)
+    rural = city == cities
+
+    sigma = spread * min(width, height)
+    x = np.empty(size)
+    y = np.empty(size)
+    urban = ~rural
+    x[urban] = rng.normal(centre_x[city[urban]], sigma)
+    y[urban] = rng.normal(centre_y[city[urban]], sigma)
+    x[rural] = rng.random(int(rural.sum())) * width
+    y[rural] = rng.random(int(rural.sum())) * height
+    return (
+        np.clip(x, 0, width).astype(np.float32),
+        np.clip(y, 0, height).astype(np.float32),
+    )
+
+
+def poisson_disk(size: int, width: int, height: int, rng, radius: float = None):
+    """
+    Place individuals at least `radius` apart from each other.
+
+    The area is divided into cells of side radius / sqrt(2), which hold at most one individual.
+    Every pass draws a candidate in each empty cell and keeps those that are far enough from the
+    individuals already placed. Cells are visited in 25 interleaved phases whose cells are more
+    than `radius` apart, so the candidates of one phase cannot conflict and are tested together.
+    Passes stop once there are enough individuals, and `size` of them are kept at random.
+
+    Args:
+        size (int): Number of individuals.
+        width (int): Width of the simulation area.
+        height (int): Height of the simulation area.
+        rng (RandomStream): Random number stream used for placement.
+        radius (float, optional): Minimum distance between individuals. Defaults to a radius that
+                                  a saturated placement reaches for about 1.5 * size individuals.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: float32 x- and y-coordinates.
+
+    Raises:
+        ValueError: If `size` individuals do not fit at the given radius.
+    """
+    if radius is None:
+        radius = math.sqrt(DISK_PACKING * 4 / math.pi * width * height / size / 1.5)
+    cell = radius / math.sqrt(2)
+    columns = max(1, math.ceil(width / cell))
+    rows = max(1, math.ceil(height / cell))
+
+    # Coordinates of the individual in each cell, padded by two empty cells on every side
+    stride = columns + 4
+    grid_x = np.zeros((rows + 4) * stride, dtype=np.float32)
+    grid_y = np.zeros((rows + 4) * stride, dtype=np.float32)
+    occupied = np.zeros((rows + 4) * stride, dtype=bool)
+    offsets = [dy * stride + dx for dx, dy in DISK_OFFSETS]
+
+    cells = np.arange((rows + 4) * stride).reshape(rows + 4, stride)[2:-2, 2:-2]
+    phases = [cells[dy::5, dx::5].ravel() for dx in range(5) for dy in range(5)]
+
+    placed = 0
+    for _ in range(DISK_ROUNDS):
+        for phase in phases:
+            phase = phase[~occupied[phase]]
+            row, column = np.divmod(phase, stride)
+            x = ((column - 2 + rng.random(len(phase))) * cell).astype(np.float32)
+            y = ((row - 2 + rng.random(len(phase))) * cell).astype(np.float32)
+
+            free = (x <= width) & (y <= height)
+            for offset in offsets:
+                # Only occupied cells can hold a conflicting individual
+                near = np.flatnonzero(free & occupied[phase + offset])
+                other = phase[near] + offset
+                free[near] = (grid_x[other] - x[near]) ** 2 + (
+                    grid_y[other] - y[near]
+                ) ** 2 >= radius * radius
+
+            grid_x[phase[free]] = x[free]
+            grid_y[phase[free]] = y[free]
+            occupied[phase[free]] = True
+            placed += int(free.sum())
+        if placed >= size:
+            break
+    else:
+        raise ValueError(
+            f"Only {placed} of {size} individuals fit {radius} apart "
+            f"in a {width} x {height} area"
+        )
+
+    chosen = np.flatnonzero(occupied)
+    chosen = chosen[rng.choice(len(chosen), size=size, replace=False)]
+    return grid_x[chosen], grid_y[chosen]
+
+
+def raster(size: int, width: int, height: int, rng, density=None):
+    """
+    Place individuals according to a population density raster.
+
+    Every individual picks a raster cell with probability proportional to its density, then a
+    uniform position inside it. Row 0 of the raster is the top of the area (y = 0).
+
+    Args:
+        size (int): Number of individuals.
+        width (int): Width of the simulation area.
+        height (int): Height of the simulation area.
+        rng (RandomStream): Random number stream used for placement.
+        density (np.ndarray): Non-negative 2D array of relative densities, e.g. a census grid.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: float32 x- and y-coordinates.
+
+    Raises:
+        ValueError: If the raster is missing, not 2D, negative or empty.
+    """
+    if density is None:
+        raise ValueError("Raster placement needs a density array")
+    density = np.asarray(density, dtype=np.float64)
+    if density.ndim != 2 or (density < 0).any() or not density.sum() > 0:
+        raise ValueError("Density must be a non-negative 2D array with a positive sum")
+
+    rows, columns = density.shape
+    cumulative = np.cumsum(density.ravel())
+    cells = np.searchsorted(cumulative, rng.random(size) * cumulative[-1], side="right")
+    row, column = np.divmod(np.minimum(cells, rows * columns - 1), columns)
+    x = (column + rng.random(size)) * (width / columns)
+    y = (row + rng.random(size)) * (height / rows)
+    return x.astype(np.float32), y.astype(np.float32)
+
+
+# Placement functions by name
+PLACEMENTS = {
+    "uniform": uniform,
+    "clustered": clustered,
+    "poisson_disk": poisson_disk,
+    "raster": raster,
+}
+
+
+def resolve_placement(placement):
+    """
+    Split a placement specification into a placement name and its options.
+
+    Args:
+        placement (str | dict): Name of a placement in PLACEMENTS, or a dict with the name
+                                under "kind" and the placement's options, e.g.
+                                {"kind": "clustered", "cities": 4}.
+
+    Returns:
+        tuple[str, dict]: Placement name and options.
+
+    Raises:
+        ValueError: If the placement is not known.
+    """
+    if isinstance(placement, str):
+        kind, options = placement, {}
+    else:
+        options = dict(placement)
+        kind = options.pop("kind", "uniform")
+    if kind not in PLACEMENTS:
+        raise ValueError(
+            f"Unknown placement {kind!r}, expected one of {tuple(PLACEMENTS)}"
+        )
+    return kind, options
+
+
+def placement_key(placement):
+    """
+    Digest identifying a placement specification, including the content of array options.
+
+    Args:
+        placement (str | dict): Placement specification, see `resolve_placement`.
+
+    Returns:
+        str: Hexadecimal SHA-256 digest, equal for equal specifications.
+    """
+    kind, options = resolve_placement(placement)
+    digest = hashlib.sha256(kind.encode())
+    for name, value in sorted(options.items()):
+        digest.update(name.encode())
+        if isinstance(value, np.ndarray):
+            digest.update(f"{value.dtype}{value.shape}".encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        else:
+            digest.update(repr(value).encode())
+    return digest.hexdigest()
+
+
+def place(placement, size: int, width: int, height: int, rng):
+    """
+    Place a population in one vectorized call.
+
+    Args:
+        placement (str | dict): Placement specification, see `resolve_placement`.
+        size (int): Number of individuals.
+        width (int): Width of the simulation area.
+        height (int): Height of the simulation area.
+        rng (RandomStream): Random number stream used for placement.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: float32 x- and y-coordinates.
+    """
+    kind, options = resolve_placement(placement)
+    return PLACEMENTS[kind](size, width, height, rng, **options)
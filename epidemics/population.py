@@ -0,0 +1,161 @@
+import numpy as np
+
+# State codes stored in Population.state
+SUSCEPTIBLE = 0
+EXPOSED = 1
+INFECTED = 2
+RECOVERED = 3
+DEAD = 4
+IMMUNE = 5
+
+STATE_LABELS = ("S", "E", "I", "R", "D", "Immune")
+STATE_CODES = {label: code for code, label in enumerate(STATE_LABELS)}
+
+# RGB colour of every state code, indexed by Population.state for rendering
+PALETTE = np.array(
+    [
+        (0, 255, 0),  # S: Green
+        (255, 255, 0),  # E: Yellow
+        (255, 0, 0),  # I: Red
+        (0, 0, 255),  # R: Blue
+        (85, 85, 85),  # D: Gray
+        (252, 0, 230),  # Immune: Pink
+    ],
+    dtype=np.uint8,
+)
+
+
+class Population:
+    """
+    Array-backed store for every individual in a simulation.
+
+    Each attribute of an individual is kept in its own contiguous NumPy array, indexed by
+    the individual's position in the population, so that daily updates can be expressed as
+    vectorized operations over masks instead of Python loops over objects.
+
+    Args:
+        size (int): Number of individuals.
+        beta (float): Initial infection transmission rate of every individual.
+
+    Attributes:
+        x (np.ndarray): float32 x-coordinates.
+        y (np.ndarray): float32 y-coordinates.
+        state (np.ndarray): uint8 state codes (SUSCEPTIBLE, EXPOSED, INFECTED, ...).
+        exposed_days (np.ndarray): int16 number of days spent in the exposed state.
+        recovered_days (np.ndarray): int16 number of days spent in the recovered state.
+        infection_count (np.ndarray): int16 number of times each individual has been infected.
+        beta (np.ndarray): float32 per-individual infection transmission rate.
+        tally (np.ndarray): Running number of individuals per state code, kept up to date by `move`.
+        susceptible (np.ndarray): Boolean mask of the susceptible individuals, kept up to date by `move`.
+        active (dict): Indices of the individuals in each state enabled by `track`, kept up to date by `move`.
+    """
+
+    def __init__(self, size: int, beta: float = 0.0):
+        self.x = np.zeros(size, dtype=np.float32)
+        self.y = np.zeros(size, dtype=np.float32)
+        self.state = np.full(size, SUSCEPTIBLE, dtype=np.uint8)
+        self.exposed_days = np.zeros(size, dtype=np.int16)
+        self.recovered_days = np.zeros(size, dtype=np.int16)
+        self.infection_count = np.zeros(size, dtype=np.int16)
+        self.beta = np.full(size, beta, dtype=np.float32)
+        self.tally = np.zeros(len(STATE_LABELS), dtype=np.int64)
+        self.tally[SUSCEPTIBLE] = size
+        self.susceptible = np.ones(size, dtype=bool)
+        self.active = {}
+
+    @classmethod
+    def from_layout(cls, layout, beta: float):
+        """
+        Create a susceptible population placed according to a layout.
+
+        The coordinate arrays are shared with the layout, which is never modified by a simulation.
+
+        Args:
+            layout (Layout): Placement of the individuals.
+            beta (float): Initial infection transmission rate of every individual.
+
+        Returns:
+            Population: The new population.
+        """
+        population = cls(len(layout), beta)
+        population.x = layout.x
+        population.y = layout.y
+        return population
+
+    def __len__(self):
+        return len(self.state)
+
+    def seed_infections(self, count: int, rng):
+        """
+        Move `count` randomly chosen individuals to the infected state.
+
+        Args:
+            count (int): Number of individuals to infect.
+            rng (np.random.Generator): Random number generator used for sampling.
+
+        Returns:
+            np.ndarray: Indices of the infected individuals.
+        """
+        chosen = rng.choice(len(self), size=count, replace=False)
+        self.move(chosen, INFECTED)
+        return chosen
+
+    def track(self, *codes: int):
+        """
+        Keep an index array of the individuals in each of the given states in `active`.
+
+        Args:
+            *codes (int): State codes to track, e.g. EXPOSED, INFECTED, RECOVERED.
+        """
+        self.active = {code: np.flatnonzero(self.state == code) for code in codes}
+
+    def current(self, code: int):
+        """
+        Members of a tracked state that take part in today's transitions.
+
+        Args:
+            code (int): State code enabled by `track`.
+
+        Returns:
+            np.ndarray: Indices of the members.
+        """
+        return self.active[code]
+
+    def members_alongside(self, indices, code: int):
+        """
+        Count the members of a state that share a population with each of the given individuals.
+
+        Args:
+            indices (np.ndarray): Indices of the individuals.
+            code (int): State code to count.
+
+        Returns:
+            int: Number of members of `code` summed over the individuals.
+        """
+        return int(len(indices) * self.tally[code])
+
+    def move(self, indices, target: int):
+        """
+        Move individuals to a new state, updating the running state counts and tracked sets.
+
+        The cost is proportional to the number of individuals moved and the size of the tracked
+        sets they leave or join, not to the population size.
+
+        Args:
+            indices (np.ndarray): Distinct indices of the individuals to move.
+            target (int): State code to move them to.
+        """
+        sources = np.bincount(self.state[indices], minlength=len(STATE_LABELS))
+        if target in self.active:
+            arriving = indices[self.state[indices] != target]
+
+        self.tally -= sources
+        self.state[indices] = target
+        self.tally[target] += len(indices)
+        self.susceptible[indices] = target == SUSCEPTIBLE
+
+        for code, members in self.active.items():
+            if code != target and sources[code]:
+                self.active[code] = members[self.state[members] == code]
+        if target in self.active:
+            self.active[target] = np.concatenate((self.active[target], arriving))
@@ -0,0 +1,181 @@
+import time
+
+import numpy as np
+
+
+class PhaseProfile:
+    """
+    Wall time and call counts of every phase of a simulation, per day.
+
+    The phases of a day run one after the other, so a single clock is enough: `lap` charges
+    the time since the previous lap to the phase that just finished. That is one
+    `time.perf_counter` call per phase, cheap enough to leave on for every run.
+
+    Args:
+        phases (list[str]): Names of the phases, in column order.
+        days (int): Maximum number of days that can be recorded.
+
+    Attributes:
+        phases (tuple[str]): Names of the phases, in column order.
+        seconds (np.ndarray): float64 array of shape (days, phases) with the time spent in
+                              every phase on every day.
+        calls (np.ndarray): int64 array of shape (days, phases) with the number of times every
+                            phase ran on every day.
+        days (int): Number of days recorded so far.
+    """
+
+    def __init__(self, phases, days: int):
+        self.phases = tuple(phases)
+        self._columns = {phase: column for column, phase in enumerate(self.phases)}
+        self.seconds = np.zeros((days, len(self.phases)))
+        self.calls = np.zeros((days, len(self.phases)), dtype=np.int64)
+        self.days = 0
+        self._clock = time.perf_counter()
+
+    def next_day(self):
+        """
+        Start recording a new day and restart the clock.
+        """
+        self.days += 1
+        self._clock = time.perf_counter()
+
+    def lap(self, phase: str):
+        """
+        Charge the time since the previous lap to a phase.
+
+        Args:
+            phase (str): Name of the phase that just finished.
+        """
+        now = time.perf_counter()
+        column = self._columns[phase]
+        self.seconds[self.days - 1, column] += now - self._clock
+        self.calls[self.days - 1, column] += 1
+        self._clock = now
+
+    def trim(self):
+        """
+        Release the rows of the days that were never recorded.
+        """
+        self.seconds = self.seconds[: self.days].copy()
+        self.calls = self.calls[: self.days].copy()
+
+    def totals(self):
+        """
+        Time and calls of every phase over the whole run.
+
+        Returns:
+            dict: Phase name mapped to its total "seconds", "calls" and "share" of the
+                  profiled time.
+        """
+        seconds = self.seconds[: self.days].sum(axis=0)
+        calls = self.calls[: self.days].sum(axis=0)
+        total = seconds.sum() or 1.0
+        return {
+            phase: {
+                "seconds": float(seconds[column]),
+                "calls": int(calls[column]),
+                "share": float(seconds[column] / total),
+            }
+            for column, phase in enumerate(self.phases)
+        }
+
+    def report(self):
+        """
+        Format the totals as a table, slowest phase first.
+
+        Returns:
+            str: One line per phase that ran.
+        """
+        totals = sorted(
+            self.totals().items(), key=lambda item: item[1]["seconds"], reverse=True
+        )
+        lines = [f"{'phase':<20} {'seconds':>10} {'calls':>8} {'share':>7}"]
+        for phase, total in totals:
+            if total["calls"]:
+                lines.append(
+                    f"{phase:<20} {total['seconds']:>10.4f} {total['calls']:>8} "
+                    f"{total['share']:>7.1%}"
+                )
+        return "\n".join(lines)
+
+
+# Operations counted per day by OperationCounts, in column order
+OPERATIONS = (
+    "contact_checks",
+    "all_pairs_checks",
+    "random_draws",
+    "infections",
+    "transitions",
+)
+
+
+class OperationCounts:
+    """
+    Amount of work done by a simulation, per day.
+
+    - contact_checks: contacts examined by the infection steps (see `contact_checks`).
+    - all_pairs_checks: distance evaluations the original object loop would have made for the
+      same spreaders, every spreader against every susceptible of its population (the members
+      of the infection's source state when the step runs).
+    - random_draws: uniform numbers drawn from the simulation's random stream.
+    - infections: individuals infected.
+    - transitions: individuals moved by the other transitions.
+
+    Args:
+        days (int): Maximum number of days that can be recorded.
+
+    Attributes:
+        counts (np.ndarray): int64 array of shape (days, operations), columns in OPERATIONS order.
+        days (int): Number of days recorded so far.
+    """
+
+    def __init__(self, days: int):
+        self.counts = np.zeros((days, len(OPERATIONS)), dtype=np.int64)
+        self.days = 0
+
+    def next_day(self):
+        """
+        Start counting a new day.
+        """
+        self.days += 1
+
+    def add(self, operation: str, count: int):
+        """
+        Count operations of the current day.
+
+        Args:
+            operation (str): Name from OPERATIONS.
+            count (int): Number of operations.
+        """
+        self.counts[self.days - 1, OPERATIONS.index(operation)] += count
+
+    def trim(self):
+        """
+        Release the rows of the days that were never recorded.
+        """
+        self.counts = self.counts[: self.days].copy()
+
+    def series(self, operation: str):
+        """
+        Daily counts of one operation.
+
+        Args:
+            operation (str): Name from OPERATIONS.
+
+        Returns:
+            np.ndarray: View of the recorded counts.
+        """
+        return self.counts[: self.days, OPERATIONS.index(operation)]
+
+    def totals(self):
+        """
+        Counts of every operation over the whole run.
+
+        Returns:
+            dict: Operation name mapped to its total count.
+        """
+        totals = self.counts[: self.days].sum(axis=0)
+        return {
+            operation: int(totals[column])
+            for column, operation in enumerate(OPERATIONS)
+        }
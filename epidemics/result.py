@@ -0,0 +1,67 @@
+import numpy as np
+
+from .population import STATE_LABELS
+
+
+class SimulationResult:
+    """
+    Daily compartment counts of a simulation run, recorded into one preallocated array.
+
+    A row is recorded per simulated day; `trim` drops the unused rows once the run is over.
+    A batched run records every replica, with a replica axis between days and compartments.
+
+    Args:
+        codes (tuple[int]): State codes of the recorded compartments, in column order.
+        max_days (int): Maximum number of days that can be recorded.
+        replicas (int, optional): Number of replicas of a batched run.
+
+    Attributes:
+        codes (np.ndarray): State codes of the recorded compartments, in column order.
+        counts (np.ndarray): int64 array of shape (max_days, compartments), or
+                             (max_days, replicas, compartments) for a batched run, holding the daily counts.
+        days (int): Number of days recorded so far.
+    """
+
+    def __init__(self, codes, max_days: int, replicas: int = None):
+        self.codes = np.asarray(codes, dtype=np.intp)
+        shape = (max_days, len(self.codes))
+        if replicas is not None:
+            shape = (max_days, replicas, len(self.codes))
+        self.counts = np.zeros(shape, dtype=np.int64)
+        self.days = 0
+
+    @property
+    def labels(self):
+        """State labels of the recorded compartments, in column order."""
+        return [STATE_LABELS[code] for code in self.codes]
+
+    def record(self, tally):
+        """
+        Record one day of compartment counts.
+
+        Args:
+            tally (np.ndarray): Number of individuals per state code, e.g. `Population.tally`,
+                                or per replica and state code for a batched run.
+        """
+        self.counts[self.days] = tally[..., self.codes]
+        self.days += 1
+
+    def trim(self):
+        """
+        Release the rows that were never recorded.
+        """
+        self.counts = self.counts[: self.days].copy()
+
+    def series(self, code: int):
+        """
+        Daily counts of one compartment.
+
+        Args:
+            code (int): State code of the compartment.
+
+        Returns:
+            np.ndarray: View of the recorded counts of the compartment, with a replica axis
+                        for a batched run.
+        """
+        column = int(np.flatnonzero(self.codes == code)[0])
+        return self.counts[: self.days, ..., column]
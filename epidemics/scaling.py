@@ -0,0 +1,169 @@
+"""
+Scaling harness fitting the empirical complexity of a model's runs versus population size.
+
+Run it from the repository root, e.g.
+
+    python -m epidemics.scaling SEIRD --start 1000 --stop 64000 --points 7
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .benchmark import MODELS, REFERENCE_POPULATION, _run_case, environment
+
+# Measures whose growth with the population size is fitted
+SCALING_METRICS = ("day_time", "memory_mb", "contact_checks_per_day")
+
+# Fitted exponents above which a measure is flagged
+SUPERLINEAR_EXPONENT = 1.15
+QUADRATIC_EXPONENT = 1.5
+
+
+def geometric_sizes(start: int, stop: int, points: int):
+    """
+    Population sizes spaced geometrically between two bounds.
+
+    Args:
+        start (int): Smallest size.
+        stop (int): Largest size.
+        points (int): Number of sizes.
+
+    Returns:
+        list[int]: Distinct sizes in increasing order.
+    """
+    return sorted({int(round(size)) for size in np.geomspace(start, stop, points)})
+
+
+def fit_exponent(sizes, values):
+    """
+    Fit values ~ c * size^k by least squares in log-log space.
+
+    Args:
+        sizes (list[int]): Population sizes.
+        values (list[float]): Measured values, one per size.
+
+    Returns:
+        dict: Exponent k, coefficient c, coefficient of determination r2 and a "linear",
+              "superlinear" or "quadratic" flag. Sizes with a non-positive value are left out;
+              the exponent is None when fewer than two remain.
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    kept = values > 0
+    if kept.sum() < 2:
+        return {"exponent": None, "coefficient": None, "r2": None, "flag": None}
+
+    log_size, log_value = np.log(sizes[kept]), np.log(values[kept])
+    exponent, intercept = np.polyfit(log_size, log_value, 1)
+    residual = log_value - (exponent * log_size + intercept)
+    spread = ((log_value - log_value.mean()) ** 2).sum()
+    r2 = 1.0 - (residual**2).sum() / spread if spread > 0 else 1.0
+
+    if exponent >= QUADRATIC_EXPONENT:
+        flag = "quadratic"
+    elif exponent >= SUPERLINEAR_EXPONENT:
+        flag = "superlinear"
+    else:
+        flag = "linear"
+    return {
+        "exponent": float(exponent),
+        "coefficient": float(np.exp(intercept)),
+        "r2": float(r2),
+        "flag": flag,
+    }
+
+
+def run_scaling(
+    name: str,
+    sizes,
+    infected_share: float = 15 / REFERENCE_POPULATION,
+    seed: int = 0,
+    max_days: int = 100,
+    output: str = None,
+):
+    """
+    Run a model over a range of population sizes at constant density and fit its complexity.
+
+    The area and the initial number of infected grow with the population, so every size sees
+    the same epidemic per individual and a code path whose cost per individual stays constant
+    fits an exponent close to 1. Every run happens in a fresh process, like the benchmarks.
+
+    Args:
+        name (str): "SIR", "SEIRS" or "SEIRD".
+        sizes (list[int]): Population sizes.
+        infected_share (float): Initial share of infected individuals. Defaults to the models'
+                                15 in 1500.
+        seed (int): Seed of every run.
+        max_days (int): Maximum number of days per run.
+        output (str, optional): Path of a JSON file to write the report to.
+
+    Returns:
+        dict: The environment, the runs and the fit of every measure in SCALING_METRICS.
+    """
+    context = multiprocessing.get_context("spawn")
+    runs = []
+    for size in sizes:
+        infected = max(1, round(size * infected_share))
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            run = executor.submit(
+                _run_case, (name, size, seed, max_days, infected)
+            ).result()
+        runs.append(run)
+        print(
+            f"{name:>5} N={size:<9} I0={infected:<7} {run['day_time'] * 1e3:9.3f} ms/day "
+            f"{run['memory_mb']:9.1f} MB {run['contact_checks_per_day']:12.0f} checks/day"
+        )
+
+    fits = {
+        metric: fit_exponent(
+            [run["size"] for run in runs], [run[metric] for run in runs]
+        )
+        for metric in SCALING_METRICS
+    }
+    for metric, fit in fits.items():
+        if fit["exponent"] is not None:
+            print(
+                f"{metric:<24} ~ N^{fit['exponent']:.2f} (r2={fit['r2']:.3f}) {fit['flag']}"
+            )
+
+    report = {"environment": environment(), "model": name, "runs": runs, "fits": fits}
+    if output is not None:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("model", choices=MODELS)
+    parser.add_argument("--start", type=int, default=1_000)
+    parser.add_argument("--stop", type=int, default=64_000)
+    parser.add_argument("--points", type=int, default=7)
+    parser.add_argument(
+        "--infected-share", type=float, default=15 / REFERENCE_POPULATION
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-days", type=int, default=100)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args(argv)
+
+    report = run_scaling(
+        args.model,
+        geometric_sizes(args.start, args.stop, args.points),
+        args.infected_share,
+        args.seed,
+        args.max_days,
+        args.output,
+    )
+    # A non-zero exit status lets CI catch a regression to an all-pairs scan
+    if any(fit["flag"] == "quadratic" for fit in report["fits"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
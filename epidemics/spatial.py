@@ -0,0 +1,252 @@
+import numpy as np
+
+# Offsets of the 3x3 block of cells around (and including) a cell
+NEIGHBOUR_OFFSETS = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+
+# Number of points queried at once while building a NeighbourGraph
+GRAPH_BLOCK_SIZE = 1 << 16
+
+
+def expand_ranges(start, lengths):
+    """
+    Expand a set of [start, start + length) ranges into one array of consecutive positions.
+
+    Args:
+        start (np.ndarray): First position of each range.
+        lengths (np.ndarray): Length of each range.
+
+    Returns:
+        np.ndarray: Concatenated positions of all ranges.
+    """
+    total = int(lengths.sum())
+    first = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.repeat(start, lengths) + np.arange(total) - first
+
+
+class SpatialHash:
+    """
+    Uniform-grid spatial index (cell list) over a set of static points.
+
+    Points are bucketed into square cells of side `cell_size`, so every point within
+    `cell_size` of a query point lies in the 3x3 block of cells around it. Queries
+    only test those candidates instead of the whole population.
+
+    Args:
+        x (np.ndarray): x-coordinates of the points.
+        y (np.ndarray): y-coordinates of the points.
+        cell_size (float): Side length of a grid cell, normally the contact radius.
+
+    Attributes:
+        x (np.ndarray): x-coordinates of the points.
+        y (np.ndarray): y-coordinates of the points.
+        cell_size (float): Side length of a grid cell.
+        columns (int): Number of cells along the x axis.
+        rows (int): Number of cells along the y axis.
+        cell_x (np.ndarray): Cell column of every point.
+        cell_y (np.ndarray): Cell row of every point.
+        order (np.ndarray): Point indices sorted by cell.
+        cell_start (np.ndarray): Offset of each cell's points in `order`, with a trailing end offset.
+    """
+
+    def __init__(self, x, y, cell_size: float):
+        self.x = x
+        self.y = y
+        # A zero radius still needs a usable grid; any positive cell size is correct for it
+        self.cell_size = float(cell_size) if cell_size > 0 else 1.0
+
+        self.cell_x = (x // self.cell_size).astype(np.intp)
+        self.cell_y = (y // self.cell_size).astype(np.intp)
+        self.columns = int(self.cell_x.max()) + 1 if len(x) else 1
+        self.rows = int(self.cell_y.max()) + 1 if len(y) else 1
+
+        cells = self.cell_y * self.columns + self.cell_x
+        self.order = np.argsort(cells, kind="stable")
+        self.cell_start = np.zeros(self.columns * self.rows + 1, dtype=np.intp)
+        np.cumsum(
+            np.bincount(cells, minlength=self.columns * self.rows),
+            out=self.cell_start[1:],
+        )
+
+    def candidates(self, sources):
+        """
+        List every point in the 3x3 block of cells around each source.
+
+        Args:
+            sources (np.ndarray): Indices of the query points.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Source and candidate indices, one entry per pair.
+        """
+        sources = np.asarray(sources, dtype=np.intp)
+        source_x = self.cell_x[sources]
+        source_y = self.cell_y[sources]
+
+        found_sources, found_candidates = [], []
+        for dx, dy in NEIGHBOUR_OFFSETS:
+            column = source_x + dx
+            row = source_y + dy
+            valid = (
+                (column >= 0) & (column < self.columns) & (row >= 0) & (row < self.rows)
+            )
+            cell = row[valid] * self.columns + column[valid]
+
+            start = self.cell_start[cell]
+            lengths = self.cell_start[cell + 1] - start
+            found_sources.append(np.repeat(sources[valid], lengths))
+            found_candidates.append(self.order[expand_ranges(start, lengths)])
+
+        return np.concatenate(found_sources), np.concatenate(found_candidates)
+
+    def query(self, sources, radius: float, mask=None):
+        """
+        Find every (source, target) pair of distinct points within `radius` of each other.
+
+        Args:
+            sources (np.ndarray): Indices of the query points.
+            radius (float): Maximum distance for a pair. Must not exceed `cell_size`.
+            mask (np.ndarray, optional): Boolean array selecting the allowed targets.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Matching source and target indices.
+        """
+        if radius > self.cell_size:
+            raise ValueError(
+                f"Query radius {radius} exceeds the grid cell size {self.cell_size}"
+            )
+
+        sources, targets = self.candidates(sources)
+        keep = sources != targets
+        if mask is not None:
+            keep &= mask[targets]
+        sources, targets = sources[keep], targets[keep]
+
+        dx = self.x[sources] - self.x[targets]
+        dy = self.y[sources] - self.y[targets]
+        within = dx * dx + dy * dy <= np.float32(radius) ** 2
+        return sources[within], targets[within]
+
+
+class NeighbourGraph:
+    """
+    Static contact graph stored as compressed sparse row (CSR) neighbour lists.
+
+    Individuals never move, so every pair within the contact radius can be found once
+    when a simulation starts. The neighbours of point `i` are
+    `indices[indptr[i]:indptr[i + 1]]`.
+
+    Args:
+        indptr (np.ndarray): Offset of each point's neighbour list, with a trailing end offset.
+        indices (np.ndarray): Concatenated neighbour lists.
+
+    Attributes:
+        indptr (np.ndarray): Offset of each point's neighbour list, with a trailing end offset.
+        indices (np.ndarray): Concatenated neighbour lists.
+    """
+
+    def __init__(self, indptr, indices):
+        self.indptr = indptr
+        self.indices = indices
+        self._matrices = {}
+
+    @classmethod
+    def from_points(cls, x, y, radius: float):
+        """
+        Build the graph of all pairs of distinct points within `radius` of each other.
+
+        Args:
+            x (np.ndarray): x-coordinates of the points.
+            y (np.ndarray): y-coordinates of the points.
+            radius (float): Maximum distance for two points to be neighbours.
+
+        Returns:
+            NeighbourGraph: The contact graph.
+        """
+        grid = SpatialHash(x, y, radius)
+        size = len(x)
+
+        found_sources, found_targets = [], []
+        for start in range(0, size, GRAPH_BLOCK_SIZE):
+            sources, targets = grid.query(
+                np.arange(start, min(start + GRAPH_BLOCK_SIZE, size)), radius
+            )
+            found_sources.append(sources)
+            found_targets.append(targets)
+
+        sources = np.concatenate(found_sources) if found_sources else np.empty(0, int)
+        targets = np.concatenate(found_targets) if found_targets else np.empty(0, int)
+        order = np.argsort(sources, kind="stable")
+
+        indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=size), out=indptr[1:])
+        return cls(indptr, targets[order].astype(np.int32))
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    @property
+    def edge_count(self):
+        """Number of directed edges in the graph."""
+        return len(self.indices)
+
+    def matrix(self, order: str = None):
+        """
+        The graph as a SciPy CSR adjacency matrix, built on first use and shared afterwards.
+
+        Entry (i, j) is 1 when j is a neighbour of i. The full matrix reuses the graph's arrays.
+
+        Args:
+            order (str, optional): "earlier" keeps only neighbours j < i (the strictly lower
+                                   triangle), "later" only neighbours j > i.
+
+        Returns:
+            scipy.sparse.csr_matrix: Square adjacency matrix of the graph.
+        """
+        if order not in self._matrices:
+            from scipy.sparse import csr_matrix, tril, triu
+
+            if order is None:
+                data = np.ones(len(self.indices), dtype=np.float64)
+                matrix = csr_matrix(
+                    (data, self.indices, self.indptr), shape=(len(self), len(self))
+                )
+            elif order == "earlier":
+                matrix = tril(self.matrix(), k=-1, format="csr")
+            else:
+                matrix = triu(self.matrix(), k=1, format="csr")
+            self._matrices[order] = matrix
+        return self._matrices[order]
+
+    def count_edges(self, sources):
+        """
+        Count the edges leaving `sources`.
+
+        Args:
+            sources (np.ndarray): Indices of the source points.
+
+        Returns:
+            int: Total number of neighbours of the sources.
+        """
+        sources = np.asarray(sources, dtype=np.intp)
+        return int((self.indptr[sources + 1] - self.indptr[sources]).sum())
+
+    def edges(self, sources, mask=None):
+        """
+        List the edges leaving `sources`, optionally keeping only targets selected by `mask`.
+
+        Args:
+            sources (np.ndarray): Indices of the source points.
+            mask (np.ndarray, optional): Boolean array selecting the allowed targets.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Source and target index of every edge.
+        """
+        sources = np.asarray(sources, dtype=np.intp)
+        start = self.indptr[sources]
+        lengths = self.indptr[sources + 1] - start
+
+        targets = self.indices[expand_ranges(start, lengths)]
+        sources = np.repeat(sources, lengths)
+        if mask is not None:
+            keep = mask[targets]
+            sources, targets = sources[keep], targets[keep]
+        return sources, targets
@@ -0,0 +1,188 @@
+import csv
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .ensemble import compartment_series, recorded_series
+from .cache import cached_layout
+from .placement import placement_key
+from .rng import RandomStream, as_seed_sequence
+
+
+def grid(**axes):
+    """
+    Build the full factorial design over the given parameter values.
+
+    Args:
+        **axes: Constructor argument names mapped to the list of values to try,
+                e.g. `grid(beta=[0.05, 0.1], gamma=[0.005, 0.01])`.
+
+    Returns:
+        list[dict]: One dictionary of constructor arguments per design point.
+    """
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+def latin_hypercube(samples: int, seed=None, **ranges):
+    """
+    Build a Latin-hypercube design over the given parameter ranges.
+
+    Each range is split into `samples` equal strata and every stratum is sampled exactly once.
+    Parameters whose bounds are both integers (e.g. kappa, proximity) are sampled as integers,
+    both bounds included.
+
+    Args:
+        samples (int): Number of design points.
+        seed (int, optional): Seed of the sampling.
+        **ranges: Constructor argument names mapped to (low, high) bounds,
+                  e.g. `latin_hypercube(20, beta=(0.02, 0.2), mu=(30, 240))`.
+
+    Returns:
+        list[dict]: One dictionary of constructor arguments per design point.
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, (low, high) in ranges.items():
+        strata = (rng.permutation(samples) + rng.random(samples)) / samples
+        if isinstance(low, int) and isinstance(high, int):
+            # One unit per integer, so both bounds are reached; the clamp guards rounding
+            values = np.floor(low + strata * (high - low + 1))
+            columns[name] = np.minimum(values, high).astype(int).tolist()
+        else:
+            columns[name] = (low + strata * (high - low)).tolist()
+    return [{name: columns[name][point] for name in ranges} for point in range(samples)]
+
+
+def summarize(series, names):
+    """
+    Reduce the daily compartment counts of a run to scalar outcome measures.
+
+    Args:
+        series (np.ndarray): Array of shape (days, compartments) from `compartment_series`.
+        names (list[str]): Series names of the columns, e.g. ["s_data", "i_data", "r_data"].
+
+    Returns:
+        dict: Run length, infection peak and final count of every compartment.
+    """
+    infected = series[:, names.index("i_data")]
+    summary = {
+        "days": len(series),
+        "peak_infected": int(infected.max()) if len(series) else 0,
+        "peak_day": int(infected.argmax()) + 1 if len(series) else 0,
+    }
+    for column, name in enumerate(names):
+        summary[f"final_{name[: -len('_data')]}"] = (
+            int(series[-1, column]) if len(series) else 0
+        )
+    return summary
+
+
+def _run_group(task):
+    model, replica, points, layout_seed, run_seeds = task
+
+    layout = None
+    rows = []
+    for (index, parameters), run_seed in zip(points, run_seeds):
+        simulation = model(seed=run_seed, **parameters)
+        if layout is None:
+            layout = cached_layout(
+                simulation.POPULATION_SIZE,
+                simulation.WIDTH,
+                simulation.HEIGHT,
+                simulation.PROXIMITY,
+                RandomStream(layout_seed),
+                simulation.PLACEMENT,
+            )
+        simulation.simulate(verbose=False, layout=layout)
+
+        summary = summarize(compartment_series(simulation), recorded_series(simulation))
+        rows.append((index, replica, summary))
+    return rows
+
+
+def run_sweep(
+    model,
+    design,
+    replicas: int = 1,
+    processes: int = None,
+    seed=None,
+    output: str = None,
+    **fixed,
+):
+    """
+    Run a model over every point of a parameter design, spread across a process pool.
+
+    Points that share a geometry (population size, width, height, proximity and placement) are
+    run in batches that place the population and build its contact graph once, then reuse it for
+    every point of the batch. Replica `r` of every point uses the same placement, so differences
+    between points are not blurred by differences between placements. With `set_cache`, the
+    layouts are also kept on disk, so later sweeps over the same geometries skip their setup.
+
+    Args:
+        model (type): Model class (SIR, SEIRS or SEIRD).
+        design (list[dict]): Constructor arguments of every point, e.g. from `grid` or `latin_hypercube`.
+        replicas (int): Number of replicas per point.
+        processes (int, optional): Number of worker processes. Defaults to the number of CPUs;
+                                   1 runs everything in the calling process.
+        seed (int | np.random.SeedSequence, optional): Root seed of the sweep.
+        output (str, optional): Path of a CSV file to write the result table to.
+        **fixed: Constructor arguments shared by every point.
+
+    Returns:
+        list[dict]: One row per run, ordered by (point, replica), with the point index, the replica,
+                    the varied parameters and the outcome measures from `summarize`.
+    """
+    root = as_seed_sequence(seed)
+    points = [{**fixed, **parameters} for parameters in design]
+
+    # Group the points by the geometry the model resolves them to
+    groups = {}
+    for index, parameters in enumerate(points):
+        simulation = model(**parameters)
+        key = (
+            simulation.POPULATION_SIZE,
+            simulation.WIDTH,
+            simulation.HEIGHT,
+            simulation.PROXIMITY,
+            placement_key(simulation.PLACEMENT),
+        )
+        groups.setdefault(key, []).append((index, parameters))
+
+    processes = processes or os.cpu_count()
+    # Enough batches to keep every worker busy, as few as possible to reuse layouts
+    batch_size = max(1, math.ceil(len(points) * replicas / (processes * 4)))
+
+    tasks = []
+    for replica, replica_seed in enumerate(root.spawn(replicas)):
+        layout_seed, runs_seed = replica_seed.spawn(2)
+        run_seeds = runs_seed.spawn(len(points))
+        for group in groups.values():
+            for start in range(0, len(group), batch_size):
+                batch = group[start : start + batch_size]
+                seeds = [run_seeds[index] for index, _ in batch]
+                tasks.append((model, replica, batch, layout_seed, seeds))
+
+    if processes == 1:
+        results = [_run_group(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_run_group, tasks))
+
+    rows = [
+        {"point": index, "replica": replica, **design[index], **summary}
+        for result in results
+        for index, replica, summary in result
+    ]
+    rows.sort(key=lambda row: (row["point"], row["replica"]))
+
+    if output is not None:
+        with open(output, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+    return rows
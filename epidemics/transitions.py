@@ -0,0 +1,348 @@
+import functools
+
+import numpy as np
+
+from .backend import get_backend
+from .infection import contact_checks, infect, infect_in_order
+from .population import STATE_LABELS, SUSCEPTIBLE
+
+
+def _value(model, parameter):
+    # Parameters are either numbers or the name of a model attribute, e.g. "GAMMA"
+    return getattr(model, parameter) if isinstance(parameter, str) else parameter
+
+
+class Transition:
+    """
+    Declarative state transition applied to every individual in `source` once per day.
+
+    Individuals that pass the guard move to `target` after a timer expires, with a daily
+    probability, or immediately when neither is given. Parameters are numbers or the name of a
+    model attribute, read when the transition runs (e.g. `rate="GAMMA"`).
+
+    Args:
+        source (int): State code the transition leaves.
+        target (int): State code the transition enters.
+        after (float | str, optional): Number of days spent in `source` before moving.
+        clock (str, optional): Population array counting the days for `after`, e.g. "exposed_days".
+        rate (float | str, optional): Daily probability of moving.
+        guard (tuple[str, float | str], optional): Population array and threshold; only
+                                                   individuals whose value is at least the
+                                                   threshold may move, e.g. ("infection_count", "KAPPA").
+        count (str, optional): Population array incremented for every individual that moves.
+
+    Attributes:
+        source, target, after, clock, rate, guard, count: As given.
+    """
+
+    def __init__(
+        self,
+        source: int,
+        target: int,
+        after=None,
+        clock: str = None,
+        rate=None,
+        guard: tuple = None,
+        count: str = None,
+    ):
+        if after is not None and rate is not None:
+            raise ValueError("A transition takes either a timer or a rate, not both")
+        if after is not None and clock is None:
+            raise ValueError("A timed transition needs a clock")
+        self.source = source
+        self.target = target
+        self.after = after
+        self.clock = clock
+        self.rate = rate
+        self.guard = guard
+        self.count = count
+
+    @property
+    def reads(self):
+        """State code whose members the transition reads."""
+        return self.source
+
+    @property
+    def label(self):
+        """Short name of the transition, e.g. "E->I"."""
+        return f"{STATE_LABELS[self.source]}->{STATE_LABELS[self.target]}"
+
+    def kernel(self, filtered: bool):
+        """
+        Compile the transition into a function of (model, members, arrivals).
+
+        Args:
+            filtered (bool): Whether an earlier step may have moved members out of `source`.
+
+        Returns:
+            callable: Kernel applying the transition to the start-of-day members of the tracked
+                      states, and adding the individuals it moves to `arrivals[target]`.
+        """
+        source, target = self.source, self.target
+        after, clock, rate = self.after, self.clock, self.rate
+        guard, count = self.guard, self.count
+
+        def run(model, members, arrivals):
+            population = model.population
+            candidates = members[source]
+            if filtered:
+                candidates = candidates[population.state[candidates] == source]
+            if guard is not None:
+                field, threshold = guard
+                values = getattr(population, field)[candidates]
+                candidates = candidates[values >= _value(model, threshold)]
+
+            if after is not None and get_backend() == "numba":
+                from .numba_kernels import tick
+
+                moving = tick(
+                    getattr(population, clock), candidates, _value(model, after)
+                )
+            elif after is not None:
+                days = getattr(population, clock)
+                days[candidates] += 1
+                moving = candidates[days[candidates] >= _value(model, after)]
+                days[moving] = 0
+            elif rate is not None:
+                draws = model.rng.random(len(candidates))
+                moving = candidates[draws < _value(model, rate)]
+            else:
+                moving = candidates
+
+            population.move(moving, target)
+            arrivals.setdefault(target, []).append(moving)
+            if count is not None:
+                getattr(population, count)[moving] += 1
+            if model.operations is not None:
+                model.operations.add("transitions", len(moving))
+
+        return run
+
+
+class Infection:
+    """
+    Declarative infection step: members of `spreaders` infect their neighbours in `source`.
+
+    Only spreaders still in their state when the step runs take part, so individuals that
+    recovered or died earlier the same day do not spread.
+
+    Args:
+        spreaders (int): State code of the infectious individuals.
+        target (int): State code newly infected individuals enter.
+        source (int): State code of the individuals that can be infected. Defaults to SUSCEPTIBLE.
+        rate (float | str): Transmission rate per contact, shared by every spreader. Defaults to "BETA".
+        decay (float | str, optional): Fraction by which a spreader's own transmission rate drops
+                                       every day it spreads. When given, rates are tracked per
+                                       individual in `population.beta` and `rate` is ignored.
+        catch_up (Transition, optional): Transition out of `target` that individuals infected
+                                         before their own turn go through the same day, as in a
+                                         sequential pass over the population in index order,
+                                         e.g. the exposed clock. When `target` is `spreaders`,
+                                         those still infectious afterwards spread in turn.
+                                         Individuals that entered `source` earlier the same day
+                                         can then only be infected by spreaders after them.
+                                         See `infect_in_order`.
+
+    Attributes:
+        spreaders, target, source, rate, decay, catch_up: As given.
+
+    Raises:
+        ValueError: If `catch_up` does not leave `target`.
+    """
+
+    def __init__(
+        self,
+        spreaders: int,
+        target: int,
+        source: int = SUSCEPTIBLE,
+        rate="BETA",
+        decay=None,
+        catch_up: Transition = None,
+    ):
+        if catch_up is not None and catch_up.source != target:
+            raise ValueError(
+                "The catch-up transition must leave the infection's target"
+            )
+        self.spreaders = spreaders
+        self.target = target
+        self.source = source
+        self.rate = rate
+        self.decay = decay
+        self.catch_up = catch_up
+
+    @property
+    def reads(self):
+        """State code whose members the step reads."""
+        return self.spreaders
+
+    @property
+    def label(self):
+        """Short name of the step, e.g. "infection I:S->E"."""
+        return (
+            f"infection {STATE_LABELS[self.spreaders]}:"
+            f"{STATE_LABELS[self.source]}->{STATE_LABELS[self.target]}"
+        )
+
+    def kernel(self, filtered: bool):
+        """
+        Compile the infection step into a function of (model, members, arrivals).
+
+        Args:
+            filtered (bool): Whether an earlier step may have moved members out of `spreaders`.
+
+        Returns:
+            callable: Kernel applying the step to the start-of-day members of the tracked states,
+                      and adding the individuals it infects to `arrivals[target]`.
+        """
+        spreading, target, source = self.spreaders, self.target, self.source
+        rate, decay, catch_up = self.rate, self.decay, self.catch_up
+        turn = catch_up.kernel(filtered=False) if catch_up is not None else None
+
+        def run(model, members, arrivals):
+            population = model.population
+            neighbours = model.neighbours
+            spreaders = members[spreading]
+            if filtered:
+                spreaders = spreaders[population.state[spreaders] == spreading]
+
+            if decay is None:
+                beta = _value(model, rate)
+            else:
+                beta = population.beta
+                beta[spreaders] *= 1 - _value(model, decay)
+
+            if source == SUSCEPTIBLE:
+                susceptible = population.susceptible
+            else:
+                susceptible = population.state == source
+            operations = model.operations
+
+            if turn is None:
+                if operations is not None:
+                    # The original loop measured distances to current members of `source` only
+                    operations.add(
+                        "all_pairs_checks",
+                        population.members_alongside(spreaders, source),
+                    )
+                infected = infect(neighbours, spreaders, beta, susceptible, model.rng)
+                population.move(infected, target)
+                arrivals.setdefault(target, []).append(infected)
+                if operations is not None:
+                    operations.add(
+                        "contact_checks", contact_checks(neighbours, spreaders, beta)
+                    )
+                    operations.add("infections", len(infected))
+                return
+
+            arrived = arrivals.get(source)
+            arrived = np.concatenate(arrived) if arrived else None
+            if target == spreading:
+                # Individuals that have not taken their turn yet, until no one new spreads
+                susceptible = susceptible.copy()
+            frontier = spreaders
+            while len(frontier):
+                if operations is not None:
+                    operations.add(
+                        "all_pairs_checks",
+                        population.members_alongside(frontier, source),
+                    )
+                infected, early = infect_in_order(
+                    neighbours, frontier, beta, susceptible, model.rng, arrived
+                )
+                # Individuals infected late by an earlier wave are already in `target`
+                infected = infected[population.state[infected] == source]
+                population.move(infected, target)
+                arrivals.setdefault(target, []).append(infected)
+                turn(model, {target: early}, arrivals)
+
+                if operations is not None:
+                    # Both orders of infect_in_order examine the contacts of the spreaders
+                    operations.add(
+                        "contact_checks", 2 * contact_checks(neighbours, frontier, beta)
+                    )
+                    operations.add("infections", len(infected))
+                if target != spreading:
+                    break
+                susceptible[early] = False
+                frontier = early[population.state[early] == spreading]
+                if decay is not None:
+                    beta[frontier] *= 1 - _value(model, decay)
+
+        return run
+
+
+class CompiledTransitions:
+    """
+    A transition list compiled into kernels.
+
+    Args:
+        tracked (tuple[int]): State codes whose members the kernels read.
+        kernels (list[callable]): Kernels in the order of the transition list.
+        labels (tuple[str]): Distinct name of every kernel, used as its profiling phase.
+
+    Attributes:
+        tracked (tuple[int]): State codes whose members the kernels read.
+        kernels (list[callable]): Kernels in the order of the transition list.
+        labels (tuple[str]): Distinct name of every kernel, used as its profiling phase.
+    """
+
+    def __init__(self, tracked, kernels, labels):
+        self.tracked = tracked
+        self.kernels = kernels
+        self.labels = labels
+
+    def advance(self, model):
+        """
+        Apply one day of the transitions to `model.population`.
+
+        Every kernel sees the members of the tracked states at the start of the day, minus those
+        already moved by an earlier kernel the same day. The individuals moved so far are kept by
+        target state in `arrivals`, for steps that follow the order of a sequential pass. With a
+        `model.profile`, gathering the members and every kernel are timed as phases of their own.
+
+        Args:
+            model (CompartmentModel): The running model.
+        """
+        members = {code: model.population.current(code) for code in self.tracked}
+        arrivals = {}
+        profile = model.profile
+        if profile is None:
+            for kernel in self.kernels:
+                kernel(model, members, arrivals)
+            return
+
+        profile.lap("members")
+        for label, kernel in zip(self.labels, self.kernels):
+            kernel(model, members, arrivals)
+            profile.lap(label)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_transitions(transitions: tuple):
+    """
+    Compile a transition list into kernels, once per list.
+
+    Steps run in the order given. A step only re-checks the state of its source members when an
+    earlier step leaves the same state, so a model pays for that filter only where it is needed.
+
+    Args:
+        transitions (tuple[Transition | Infection]): The model's transitions, in daily order.
+
+    Returns:
+        CompiledTransitions: The compiled transitions.
+    """
+    tracked = []
+    left = set()
+    kernels = []
+    labels = []
+    for transition in transitions:
+        if transition.reads not in tracked:
+            tracked.append(transition.reads)
+        kernels.append(transition.kernel(filtered=transition.reads in left))
+        left.add(transition.source)
+
+        label = transition.label
+        if label in labels:
+            label = f"{label} #{len(labels) + 1}"
+        labels.append(label)
+    return CompiledTransitions(tuple(tracked), kernels, tuple(labels))
@@ -0,0 +1,306 @@
+"""
+Statistical equivalence harness between the original object loops and the compiled engine.
+
+Run it from the repository root, e.g.
+
+    python -m epidemics.validation SEIRD --replicas 200 --set mu=60
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .backend import get_backend, set_backend
+from .benchmark import MODELS, load_model, scaled_area
+from .legacy import run_legacy
+from .population import DEAD, INFECTED, SUSCEPTIBLE
+from .rng import as_seed_sequence
+
+# Outcome measures compared between the engines
+OUTCOME_MEASURES = ("peak_size", "peak_day", "final_size", "duration", "deaths")
+
+# Number of label shuffles of the permutation test
+PERMUTATIONS = 2000
+
+# Constructor arguments of the command line runs. A small population keeps the O(I * N)
+# original loop affordable, and a short infectious period lets epidemics end well before
+# MAX_DAYS, so no outcome is cut off by the cap
+VALIDATION_PARAMETERS = {
+    "population": 200,
+    "initial_infected": 4,
+    "gamma": 0.05,
+    "max_days": 1000,
+}
+
+
+def outcome_measures(counts, simulation):
+    """
+    Summarize one run by the outcome measures compared between engines.
+
+    Args:
+        counts (np.ndarray): Daily counts of shape (days, compartments), columns in the
+                             model's COMPARTMENTS order.
+        simulation (CompartmentModel): Model instance the run used the parameters of.
+
+    Returns:
+        dict: Peak number of infected, day of the peak, final size (individuals no longer
+              susceptible at the end), duration in days and, for models with a dead
+              compartment, the death count. "capped" tells whether the run was still going
+              when it reached MAX_DAYS.
+    """
+    columns = {code: column for column, code in enumerate(simulation.COMPARTMENTS)}
+    infected = counts[:, columns[INFECTED]]
+    empty = len(counts) == 0
+    measures = {
+        "peak_size": 0 if empty else int(infected.max()),
+        "peak_day": 0 if empty else int(infected.argmax()) + 1,
+        "final_size": (
+            0
+            if empty
+            else simulation.POPULATION_SIZE - int(counts[-1, columns[SUSCEPTIBLE]])
+        ),
+        "duration": len(counts),
+    }
+    if DEAD in columns:
+        measures["deaths"] = 0 if empty else int(counts[-1, columns[DEAD]])
+    ongoing = [columns[code] for code in simulation.ONGOING]
+    measures["capped"] = bool(not empty and counts[-1, ongoing].any())
+    return measures
+
+
+def ks_test(first, second):
+    """
+    Two-sample Kolmogorov-Smirnov test.
+
+    Args:
+        first (np.ndarray): First sample.
+        second (np.ndarray): Second sample.
+
+    Returns:
+        tuple[float, float]: Largest distance between the empirical distribution functions and
+                             its asymptotic p-value. Ties make the p-value conservative.
+    """
+    first = np.sort(np.asarray(first, dtype=np.float64))
+    second = np.sort(np.asarray(second, dtype=np.float64))
+    values = np.concatenate((first, second))
+    distance = np.abs(
+        np.searchsorted(first, values, side="right") / len(first)
+        - np.searchsorted(second, values, side="right") / len(second)
+    ).max()
+
+    effective = np.sqrt(len(first) * len(second) / (len(first) + len(second)))
+    statistic = (effective + 0.12 + 0.11 / effective) * distance
+    if statistic < 0.2:
+        return float(distance), 1.0
+    terms = np.arange(1, 101)
+    p_value = 2 * np.sum((-1.0) ** (terms - 1) * np.exp(-2 * terms**2 * statistic**2))
+    return float(distance), float(np.clip(p_value, 0.0, 1.0))
+
+
+def permutation_test(first, second, rng, permutations: int = PERMUTATIONS):
+    """
+    Two-sided permutation test of a difference in means.
+
+    Args:
+        first (np.ndarray): First sample.
+        second (np.ndarray): Second sample.
+        rng (np.random.Generator): Random number generator used for the shuffles.
+        permutations (int): Number of shuffles.
+
+    Returns:
+        tuple[float, float]: Difference of the means (second - first) and its p-value.
+    """
+    pooled = np.concatenate((first, second)).astype(np.float64)
+    observed = pooled[len(first) :].mean() - pooled[: len(first)].mean()
+
+    shuffles = np.argsort(rng.random((permutations, len(pooled))), axis=1)
+    shuffled = pooled[shuffles]
+    differences = shuffled[:, len(first) :].mean(axis=1) - shuffled[
+        :, : len(first)
+    ].mean(axis=1)
+    extreme = np.count_nonzero(np.abs(differences) >= abs(observed) - 1e-12)
+    return float(observed), float((extreme + 1) / (permutations + 1))
+
+
+def _run_legacy(task):
+    model, parameters, seed = task
+    simulation = model(**parameters)
+    return outcome_measures(run_legacy(simulation, seed), simulation)
+
+
+def _run_candidate(task):
+    model, parameters, seed, backend = task
+    # Runs in the calling process when processes=1, which keeps its own backend
+    previous = get_backend()
+    set_backend(backend)
+    try:
+        simulation = model(seed=seed, **parameters)
+        simulation.simulate(verbose=False)
+    finally:
+        set_backend(previous)
+    return outcome_measures(simulation.result.counts, simulation)
+
+
+def compare_engines(
+    model,
+    replicas: int = 100,
+    seed=None,
+    backend: str = None,
+    alpha: float = 0.05,
+    processes: int = None,
+    candidate_model=None,
+    **parameters,
+):
+    """
+    Compare the outcome distributions of the original object loop and the compiled engine.
+
+    Both engines run `replicas` independent epidemics with the same parameters. Every outcome
+    measure is compared with a Kolmogorov-Smirnov test of the distributions and a permutation
+    test of the means. A measure passes when neither test rejects at `alpha`, Bonferroni
+    corrected for the number of tests, so equivalent engines pass every measure with
+    probability at least 1 - alpha.
+
+    Runs still going at MAX_DAYS have their duration, peak and final size cut off by the cap,
+    which hides differences; the report gives the share of them, and a comparison with capped
+    runs is only conclusive once MAX_DAYS is raised.
+
+    The harness does catch a known difference: with the command line defaults and 200
+    replicas, an SIR engine without same-day catch-up spreading (`Infection(INFECTED,
+    INFECTED)`) fails on peak size and peak day with p-values below 1e-4.
+
+    Args:
+        model (type): Model class (SIR, SEIRS or SEIRD).
+        replicas (int): Number of runs per engine.
+        seed (int | np.random.SeedSequence, optional): Root seed of the comparison.
+        backend (str, optional): Backend of the compiled engine. Defaults to the selected one.
+        alpha (float): Family-wise significance level.
+        processes (int, optional): Number of worker processes. Defaults to the number of CPUs;
+                                   1 runs everything in the calling process.
+        candidate_model (type, optional): Model class run by the engine instead of `model`,
+                                          e.g. a variant with other transitions, to check
+                                          that the harness detects a known difference.
+        **parameters: Constructor arguments of both engines, e.g. population=200.
+
+    Returns:
+        dict: Per measure the means of both engines, the test statistics and p-values and
+              whether it passed; "passed" is True when every measure passed, and "capped"
+              gives the share of capped runs of each engine.
+    """
+    backend = backend or get_backend()
+    root = as_seed_sequence(seed)
+    legacy_seed, candidate_seed, test_seed = root.spawn(3)
+    legacy_tasks = [(model, parameters, child) for child in legacy_seed.spawn(replicas)]
+    candidate_tasks = [
+        (candidate_model or model, parameters, child, backend)
+        for child in candidate_seed.spawn(replicas)
+    ]
+
+    processes = processes or os.cpu_count()
+    if processes == 1:
+        legacy = [_run_legacy(task) for task in legacy_tasks]
+        candidate = [_run_candidate(task) for task in candidate_tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            legacy = list(executor.map(_run_legacy, legacy_tasks))
+            candidate = list(executor.map(_run_candidate, candidate_tasks))
+
+    measures = [name for name in OUTCOME_MEASURES if name in legacy[0]]
+    threshold = alpha / (2 * len(measures))
+    rng = np.random.default_rng(test_seed)
+
+    report = {
+        "backend": backend,
+        "replicas": replicas,
+        "threshold": threshold,
+        "capped": {
+            "legacy": float(np.mean([run["capped"] for run in legacy])),
+            "candidate": float(np.mean([run["capped"] for run in candidate])),
+        },
+    }
+    for name in measures:
+        first = np.array([run[name] for run in legacy])
+        second = np.array([run[name] for run in candidate])
+        distance, ks_p = ks_test(first, second)
+        difference, mean_p = permutation_test(first, second, rng)
+        report[name] = {
+            "legacy_mean": float(first.mean()),
+            "candidate_mean": float(second.mean()),
+            "ks_statistic": distance,
+            "ks_p": ks_p,
+            "mean_difference": difference,
+            "mean_p": mean_p,
+            "passed": bool(min(ks_p, mean_p) >= threshold),
+        }
+    report["passed"] = all(report[name]["passed"] for name in measures)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("model", choices=MODELS)
+    parser.add_argument("--replicas", type=int, default=200)
+    parser.add_argument("--backend", default=None)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="constructor argument overriding VALIDATION_PARAMETERS, e.g. mu=60",
+    )
+    args = parser.parse_args(argv)
+
+    parameters = dict(VALIDATION_PARAMETERS)
+    for assignment in args.set:
+        name, value = assignment.split("=", 1)
+        parameters[name] = json.loads(value)
+    # Keep the default density
+    parameters.setdefault("width", scaled_area(parameters["population"])[0])
+    parameters.setdefault("height", scaled_area(parameters["population"])[1])
+
+    report = compare_engines(
+        load_model(args.model),
+        args.replicas,
+        args.seed,
+        args.backend,
+        args.alpha,
+        args.processes,
+        **parameters,
+    )
+
+    print(
+        f"{args.model}: {args.replicas} replicas per engine, backend {report['backend']}, "
+        f"p-value threshold {report['threshold']:.4f}"
+    )
+    print(
+        f"{'measure':<12} {'legacy':>10} {'engine':>10} {'KS':>7} {'KS p':>8} "
+        f"{'mean p':>8}"
+    )
+    for name in OUTCOME_MEASURES:
+        if name in report:
+            result = report[name]
+            print(
+                f"{name:<12} {result['legacy_mean']:>10.2f} {result['candidate_mean']:>10.2f} "
+                f"{result['ks_statistic']:>7.3f} {result['ks_p']:>8.4f} "
+                f"{result['mean_p']:>8.4f}  {'pass' if result['passed'] else 'FAIL'}"
+            )
+    if not report["passed"]:
+        sys.exit(1)
+    capped = report["capped"]
+    if capped["legacy"] or capped["candidate"]:
+        # Censored outcomes can hide a difference, so a pass is not conclusive
+        print(
+            f"{capped['legacy']:.0%} of the original runs and {capped['candidate']:.0%} of "
+            f"the engine runs reached max_days={parameters['max_days']}; raise it"
+        )
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
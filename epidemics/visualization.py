@@ -0,0 +1,67 @@
+import numpy as np
+
+from .population import PALETTE
+
+
+class LiveView:
+    """
+    Pygame window that shows the population while a simulation runs.
+
+    Pygame is imported when the window is created, so headless runs never load it.
+
+    Args:
+        caption (str): Initial window caption.
+        width (int): Width of the window.
+        height (int): Height of the window.
+
+    Attributes:
+        screen (pygame.Surface): The Pygame screen the population is drawn on.
+    """
+
+    def __init__(self, caption: str, width: int, height: int):
+        import pygame
+
+        self._pygame = pygame
+
+        # Pygame setup
+        pygame.init()
+
+        self.screen = pygame.display.set_mode((width, height))
+        pygame.display.set_caption(caption)
+
+    def handle_events(self):
+        """
+        Process pending window events, closing Pygame and exiting when the window is closed.
+        """
+        for event in self._pygame.event.get():
+            if event.type == self._pygame.QUIT:
+                self._pygame.quit()
+                exit()
+
+    def draw(self, population, caption: str, palette=PALETTE):
+        """
+        Draw every individual as a colored circle, to be shown by `flip`.
+
+        Args:
+            population (Population): The population to draw.
+            caption (str): Window caption for this frame.
+            palette (np.ndarray): RGB color of every state code, indexed by `population.state`.
+        """
+        # Set the background color to white (RGB: 255, 255, 255)
+        self.screen.fill((255, 255, 255))
+
+        colors = palette[population.state].tolist()
+        for x, y, color in zip(
+            population.x.astype(np.int32).tolist(),
+            population.y.astype(np.int32).tolist(),
+            colors,
+        ):
+            self._pygame.draw.circle(self.screen, color, (x, y), 5)
+
+        self._pygame.display.set_caption(caption)
+
+    def flip(self):
+        """
+        Show the frame drawn by `draw`.
+        """
+        self._pygame.display.flip()